@@ -0,0 +1,277 @@
+import time
+import json
+import argparse
+import tracemalloc
+import numpy as np
+from simulationKernels import *
+from coverageQuadtree import build_coverage_quadtree
+
+
+# ----------------------------------------------------------------------
+# KERNEL MICRO-BENCHMARKS
+# ----------------------------------------------------------------------
+
+# Times the numeric kernels used by monteSimulation.py on synthetic ground
+# tracks and event lists, without MONTE. Every kernel runs once on a small
+# track first so numba compilation is not counted. Throughput is in
+# samples per second (events per second for the event kernels) and peak
+# memory is the largest traced NumPy/Python allocation during the call;
+# arrays allocated inside numba kernels are not traced.
+#
+#   python benchmarkKernels.py
+#   python benchmarkKernels.py --days 1 7 --steps 60 10 --kernels coverage quadtree
+
+EARTH_MU = 398600.4418
+EARTH_RADIUS_EQ = 6378.137
+EARTH_RADIUS_POLE = 6356.752
+EARTH_J2 = 1.08263e-3
+EARTH_SPIN_RATE = 7.2921159e-5
+
+ORBIT_ALTITUDE_KM = 500.0
+ORBIT_INCLINATION_DEG = 51.6
+SENSOR_FOV_DEG = 30.0
+
+# Depth monteSimulation.py picks for this sensor and altitude (10 km leaves)
+QUADTREE_DEPTH = 7
+
+STATIONS = {"DSS-14": (35.4, -116.9), "DSS-43": (-35.4, 148.98), "DSS-63": (40.4, -4.25)}
+
+def cprint(txt,color="92"):
+
+    color_map = {
+        "red":"91",
+        "green":"92",
+        "yellow":"93",
+        "blue":"94",
+        "purple":"35"
+    }
+
+    color_code = color_map.get(color.lower(),"0")
+
+    print(f"\033[{color_code}m{txt}\033[0m")
+
+
+# ----------------------------------------------------------------------
+# SYNTHETIC INPUTS
+# ----------------------------------------------------------------------
+
+def synthetic_track(days, step_seconds):
+
+    # Circular inclined orbit over a rotating spherical-ish primary
+
+    times = np.arange(0.0, days*86400.0, step_seconds)
+
+    sma = EARTH_RADIUS_EQ + ORBIT_ALTITUDE_KM
+    mean_motion = np.sqrt(EARTH_MU/sma**3)
+    inclination = np.radians(ORBIT_INCLINATION_DEG)
+
+    u = mean_motion*times
+    orbit_x = sma*np.cos(u)
+    orbit_y = sma*np.sin(u)
+
+    positions = np.stack([orbit_x, orbit_y*np.cos(inclination), orbit_y*np.sin(inclination)], axis=1)
+    speed = sma*mean_motion
+    velocities = np.stack([-speed*np.sin(u), speed*np.cos(u)*np.cos(inclination), speed*np.cos(u)*np.sin(inclination)], axis=1)
+
+    spin = EARTH_SPIN_RATE*times
+    fixed = np.stack([np.cos(spin)*positions[:, 0] + np.sin(spin)*positions[:, 1],
+                      -np.sin(spin)*positions[:, 0] + np.cos(spin)*positions[:, 1],
+                      positions[:, 2]], axis=1)
+
+    lat, lon, height = geodetic_from_cartesian(fixed, EARTH_RADIUS_EQ, EARTH_RADIUS_POLE)
+
+    return {
+        "time": times,
+        "position": positions,
+        "velocity": velocities,
+        "fixed": fixed,
+        "latitude": lat,
+        "longitude": lon,
+        "height": height,
+        "period": 2*np.pi/mean_motion,
+        "sma": sma,
+    }
+
+def synthetic_events(days, period, seed=0):
+
+    # Rise/set pairs for a few passes per station per day and one umbra
+    # interval per orbit, in seconds past t0 (t0_et = 0)
+
+    rng = np.random.default_rng(seed)
+    duration = days*86400.0
+    records = []
+
+    for station in STATIONS:
+        starts = np.sort(rng.uniform(0.0, duration, int(5*days) + 1))
+        lengths = rng.uniform(300.0, 600.0, len(starts))
+        for begin, length in zip(starts, lengths):
+            records.append((station, "rise", begin, begin))
+            records.append((station, "set", begin + length, begin + length))
+
+    contact_events = np.array(records, dtype=EVENT_DTYPE)
+
+    starts = np.arange(0.0, duration, period) + 0.6*period
+    shadow_events = np.zeros(len(starts), dtype=EVENT_DTYPE)
+    shadow_events["source"] = "Earth"
+    shadow_events["kind"] = "umbra"
+    shadow_events["begin_et"] = starts
+    shadow_events["end_et"] = starts + 0.35*period
+
+    return contact_events, shadow_events
+
+
+# ----------------------------------------------------------------------
+# KERNELS
+# ----------------------------------------------------------------------
+
+# Each entry takes (track, contact_events, shadow_events) and returns the
+# number of items it processed, which throughput is reported against.
+
+def bench_geodetic(track, contact_events, shadow_events):
+    geodetic_from_cartesian(track["fixed"], EARTH_RADIUS_EQ, EARTH_RADIUS_POLE)
+    return len(track["time"])
+
+def bench_elements(track, contact_events, shadow_events):
+    orbital_elements_from_cartesian(track["position"], track["velocity"], EARTH_MU)
+    return len(track["time"])
+
+def bench_swath_edges(track, contact_events, shadow_events):
+    compute_swath_edges_great_circle(track["latitude"], track["longitude"], track["height"],
+                                     SENSOR_FOV_DEG, EARTH_RADIUS_EQ, EARTH_RADIUS_POLE)
+    return len(track["time"])
+
+def bench_swath_polygons(track, contact_events, shadow_events):
+    build_swath_polygons_from_track_pairwise(track["latitude"], track["longitude"], track["height"],
+                                             SENSOR_FOV_DEG, EARTH_RADIUS_EQ, EARTH_RADIUS_POLE)
+    return len(track["time"])
+
+def coverage_bench(grid_type, lat_res, lon_res):
+
+    def bench(track, contact_events, shadow_events):
+        in_shadow = event_timeline(shadow_events, 0.0, track["time"])
+        calculate_coverage(track["latitude"], track["longitude"], track["height"], in_shadow,
+                           SENSOR_FOV_DEG, lat_res, lon_res, EARTH_RADIUS_EQ, EARTH_RADIUS_POLE,
+                           track["time"], grid_type)
+        return len(track["time"])
+
+    return bench
+
+def bench_quadtree(track, contact_events, shadow_events):
+    poly_lat, poly_lon = build_swath_polygons_from_track_pairwise(track["latitude"], track["longitude"], track["height"],
+                                                                  SENSOR_FOV_DEG, EARTH_RADIUS_EQ, EARTH_RADIUS_POLE)
+    build_coverage_quadtree(poly_lat, poly_lon, QUADTREE_DEPTH, 10.0, "sphere")
+    return len(track["time"])
+
+def bench_contact_matrix(track, contact_events, shadow_events):
+    contact_matrix(contact_events, list(STATIONS), 0.0, track["time"][-1], track["time"])
+    return len(contact_events)
+
+def bench_shadow_timeline(track, contact_events, shadow_events):
+    event_timeline(shadow_events, 0.0, track["time"])
+    return len(shadow_events)
+
+def bench_contact_durations(track, contact_events, shadow_events):
+    calculate_contact_durations(contact_events, list(STATIONS), track["period"], 0.0, track["time"][-1])
+    return len(contact_events)
+
+def bench_repeat_search(track, contact_events, shadow_events):
+    revs_per_day = repeat_revs_per_day(track["sma"], 0.0, np.radians(ORBIT_INCLINATION_DEG), EARTH_MU,
+                                       EARTH_J2, EARTH_RADIUS_EQ, EARTH_SPIN_RATE)
+    repeat_ground_track_candidates(revs_per_day, max_days=100000)
+    return 100000
+
+KERNELS = {
+    "geodetic": bench_geodetic,
+    "elements": bench_elements,
+    "swath_edges": bench_swath_edges,
+    "swath_polygons": bench_swath_polygons,
+    "coverage": coverage_bench("equirectangular", .125, .25),
+    "coverage_equal_area": coverage_bench("equal_area", .25, .125),
+    "quadtree": bench_quadtree,
+    "contact_matrix": bench_contact_matrix,
+    "shadow_timeline": bench_shadow_timeline,
+    "contact_durations": bench_contact_durations,
+    "repeat_search": bench_repeat_search,
+}
+
+
+# ----------------------------------------------------------------------
+# HARNESS
+# ----------------------------------------------------------------------
+
+def measure(kernel, inputs):
+
+    tracemalloc.start()
+    begin = time.perf_counter()
+
+    items = kernel(*inputs)
+
+    elapsed = time.perf_counter() - begin
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return items, elapsed, peak
+
+def run_benchmarks(days_list, steps_list, kernel_names):
+
+    warm_track = synthetic_track(0.1, 60.0)
+    warm_inputs = (warm_track,) + synthetic_events(0.1, warm_track["period"])
+
+    for name in kernel_names:
+        KERNELS[name](*warm_inputs)
+
+    results = []
+
+    for days in days_list:
+        for step in steps_list:
+
+            track = synthetic_track(days, step)
+            inputs = (track,) + synthetic_events(days, track["period"])
+
+            for name in kernel_names:
+
+                items, elapsed, peak = measure(KERNELS[name], inputs)
+
+                results.append({
+                    "kernel": name,
+                    "days": days,
+                    "step_seconds": step,
+                    "samples": len(track["time"]),
+                    "items": items,
+                    "seconds": elapsed,
+                    "items_per_second": items/elapsed if elapsed > 0 else float("inf"),
+                    "peak_mb": peak/2**20,
+                })
+
+                print_result(results[-1])
+
+            del track, inputs
+
+    return results
+
+def print_result(result):
+
+    print(f"{result['kernel']:<20}{result['days']:>6g} d{result['step_seconds']:>6g} s"
+          f"{result['samples']:>12,d}{result['seconds']:>11.3f} s"
+          f"{result['items_per_second']:>14,.0f} /s{result['peak_mb']:>10.1f} MB")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Benchmark the simulation kernels on synthetic tracks")
+    parser.add_argument("--days", type=float, nargs="+", default=[1, 7, 30, 90])
+    parser.add_argument("--steps", type=float, nargs="+", default=[60, 10, 1])
+    parser.add_argument("--kernels", nargs="+", choices=list(KERNELS), default=list(KERNELS))
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    cprint("Kernel Benchmarks","blue")
+    print(f"{'kernel':<20}{'days':>8}{'step':>8}{'samples':>12}{'time':>13}{'throughput':>16}{'peak':>13}")
+
+    results = run_benchmarks(args.days, args.steps, args.kernels)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=1)
+
+    cprint("Kernel Benchmarks Complete","green")
@@ -0,0 +1,112 @@
+from functools import lru_cache
+import numpy as np
+
+
+# ----------------------------------------------------------------------
+# EQUAL-AREA COVERAGE GRID
+# ----------------------------------------------------------------------
+
+# Latitude bands of lat_res degrees, each split into as many longitude
+# cells as keeps the cell width close to lon_res at the band centre. Cells
+# are stored band after band in one flat array; band_offset[b] is the
+# index of the first cell of band b. Every cell within a band has the same
+# area, so cell_weight is exact on the sphere and sums to one.
+#
+# Tables only depend on the resolution and are cached, read-only, for the
+# life of the process. This module only needs numpy so the viewers can
+# decode equal-area arrays too.
+
+GRID_TYPES = ("equirectangular", "equal_area")
+
+@lru_cache(maxsize=8)
+def equal_area_grid(lat_res_deg, lon_res_deg):
+
+    n_bands = int(round(180.0/lat_res_deg))
+    band_edges = 90.0 - np.arange(n_bands + 1)*180.0/n_bands
+    band_lat = (band_edges[:-1] + band_edges[1:])/2
+
+    band_cols = np.maximum(np.round(360.0/lon_res_deg*np.cos(np.radians(band_lat))), 1).astype(np.int64)
+    band_offset = np.concatenate([[0], np.cumsum(band_cols)[:-1]]).astype(np.int64)
+
+    band_area = (np.sin(np.radians(band_edges[:-1])) - np.sin(np.radians(band_edges[1:])))/2
+
+    cell_band = np.repeat(np.arange(n_bands), band_cols)
+    cell_index = np.arange(band_cols.sum()) - band_offset[cell_band]
+
+    grid = {
+        "band_lat": band_lat,
+        "band_cols": band_cols,
+        "band_offset": band_offset,
+        "cell_lat": band_lat[cell_band],
+        "cell_lon": -180.0 + (cell_index + 0.5)*360.0/band_cols[cell_band],
+        "cell_weight": (band_area/band_cols)[cell_band],
+    }
+
+    for table in grid.values():
+        table.setflags(write=False)
+
+    return grid
+
+def equal_area_to_raster(values, lat_res_deg, lon_res_deg, latitudes, longitudes):
+
+    # Samples flat equal-area cell values at the given latitude/longitude
+    # vectors (degrees), returning a (len(latitudes), len(longitudes)) array
+
+    values = np.asarray(values)
+    grid = equal_area_grid(lat_res_deg, lon_res_deg)
+
+    latitudes = np.asarray(latitudes, dtype=float)
+    longitudes = (np.asarray(longitudes, dtype=float) + 180.0) % 360.0 - 180.0
+
+    n_bands = len(grid["band_lat"])
+    bands = np.clip(np.floor((90.0 - latitudes)*n_bands/180.0), 0, n_bands - 1).astype(np.int64)
+
+    n_cols = grid["band_cols"][bands][:, None]
+    cols = np.minimum(np.floor((longitudes[None, :] + 180.0)/360.0*n_cols), n_cols - 1).astype(np.int64)
+
+    return values[grid["band_offset"][bands][:, None] + cols]
+
+def coverage_raster(values, grid_type, lat_res_deg, lon_res_deg, latitudes, longitudes):
+
+    # Either grid type resampled to a display raster
+
+    if grid_type == "equal_area":
+        return equal_area_to_raster(values, lat_res_deg, lon_res_deg, latitudes, longitudes)
+
+    values = np.asarray(values)
+    rows = np.clip(np.round((90.0 - np.asarray(latitudes, dtype=float))/lat_res_deg), 0, values.shape[0] - 1).astype(np.int64)
+    cols = (np.floor((np.asarray(longitudes, dtype=float) + 180.0)/lon_res_deg).astype(np.int64)) % values.shape[1]
+
+    return values[rows[:, None], cols[None, :]]
+
+
+# ----------------------------------------------------------------------
+# COMPACT COVERAGE STORAGE
+# ----------------------------------------------------------------------
+
+# Binary coverage grids are held and exported bit-packed with np.packbits
+# as {"encoding", "shape", "data"} dicts; a 2M cell grid packs into 260 kB.
+# Viewers call decode_grid only for the grids they actually draw.
+
+def pack_coverage(values):
+
+    values = np.asarray(values)
+
+    return {
+        "encoding": "packbits",
+        "shape": list(values.shape),
+        "data": np.packbits(values.astype(bool), axis=None),
+    }
+
+def decode_grid(encoded):
+
+    if not (isinstance(encoded, dict) and "encoding" in encoded):
+        return np.asarray(encoded)
+
+    shape = tuple(encoded["shape"])
+
+    if encoded["encoding"] == "packbits":
+        size = int(np.prod(shape))
+        return np.unpackbits(np.asarray(encoded["data"], dtype=np.uint8), count=size).reshape(shape)
+
+    raise ValueError(f"Unknown grid encoding: {encoded['encoding']}")
@@ -0,0 +1,322 @@
+import numpy as np
+
+
+# ----------------------------------------------------------------------
+# ADAPTIVE QUADTREE COVERAGE GRID
+# ----------------------------------------------------------------------
+
+# Coverage is stored as a quadtree over square lat/lon tiles. The globe is
+# split into root tiles of root_deg degrees and every tile is refined into
+# four children only while an outer edge of the swath strip (the left and
+# right track edges plus the two end caps) passes through it. Tiles no
+# edge passes through are uniformly covered or uniformly empty, decided by
+# testing the tile centre against the swath quadrilaterals that overlap
+# it. Tiles still crossed by an edge at max_depth are the only source of
+# error; their area bounds it. Memory therefore scales with the swath
+# perimeter rather than with the number of cells on the globe.
+#
+# Areas and percentages are fractions of the sphere when area is "sphere",
+# or fractions of the lat/lon plane (the measure of a uniform lat/lon
+# raster) when area is "plane". This module only needs numpy so the
+# viewers can import it to flatten a tree at their display resolution.
+
+def tile_size_deg(root_deg, level):
+
+    return root_deg / 2**level
+
+def tile_bounds(rows, cols, size):
+
+    lat_hi = 90.0 - rows*size
+    lon_lo = -180.0 + cols*size
+
+    return lat_hi - size, lat_hi, lon_lo, lon_lo + size
+
+def edge_side(x1, y1, x2, y2, px, py):
+
+    return (x2 - x1)*(py - y1) - (y2 - y1)*(px - x1)
+
+def segments_hit_tiles(x1, y1, x2, y2, lat_lo, lat_hi, lon_lo, lon_hi):
+
+    # Separating axis test of segments against axis aligned tiles
+
+    overlap = ((np.minimum(x1, x2) <= lon_hi) & (np.maximum(x1, x2) >= lon_lo) &
+               (np.minimum(y1, y2) <= lat_hi) & (np.maximum(y1, y2) >= lat_lo))
+
+    sides = np.stack([edge_side(x1, y1, x2, y2, lon_lo, lat_lo),
+                      edge_side(x1, y1, x2, y2, lon_hi, lat_lo),
+                      edge_side(x1, y1, x2, y2, lon_lo, lat_hi),
+                      edge_side(x1, y1, x2, y2, lon_hi, lat_hi)])
+
+    return overlap & ~(np.all(sides > 0, axis=0) | np.all(sides < 0, axis=0))
+
+def points_in_quads(px, py, quad_lat, quad_lon):
+
+    # Even-odd rule, same crossing test as the raster coverage kernel
+
+    inside = np.zeros(px.shape, dtype=bool)
+    n_vert = quad_lat.shape[1]
+
+    for i in range(n_vert):
+        j = (i - 1) % n_vert
+        xi, yi = quad_lon[:, i], quad_lat[:, i]
+        xj, yj = quad_lon[:, j], quad_lat[:, j]
+        crosses = ((yi > py) != (yj > py)) & (px < (xj - xi)*(py - yi)/(yj - yi + 1e-12) + xi)
+        inside ^= crosses
+
+    return inside
+
+def wrap_quads(poly_lat, poly_lon, boundary):
+
+    # Quadrilaterals reaching past +-180 get a copy shifted by 360 degrees
+
+    lon_min = poly_lon.min(axis=1)
+    lon_max = poly_lon.max(axis=1)
+
+    east = lon_max >= 180.0
+    west = lon_min < -180.0
+
+    poly_lat = np.concatenate([poly_lat, poly_lat[east], poly_lat[west]])
+    poly_lon = np.concatenate([poly_lon, poly_lon[east] - 360.0, poly_lon[west] + 360.0])
+    boundary = np.concatenate([boundary, boundary[east], boundary[west]])
+
+    return poly_lat, poly_lon, boundary
+
+def strip_boundary_edges(num_quads):
+
+    # Quad p has vertices (left p, left p+1, right p+1, right p). Edge k
+    # runs from vertex k-1 to vertex k, so edges 0 and 2 close the strip
+    # caps and edges 1 and 3 are the left and right swath edges.
+
+    boundary = np.zeros((num_quads, 4), dtype=bool)
+    boundary[:, 1] = True
+    boundary[:, 3] = True
+
+    if num_quads > 0:
+        boundary[0, 0] = True
+        boundary[-1, 2] = True
+
+    return boundary
+
+def root_pairs(poly_lat, poly_lon, root_deg):
+
+    n_rows = int(round(180.0/root_deg))
+    n_cols = int(round(360.0/root_deg))
+
+    r0 = np.clip(np.floor((90.0 - poly_lat.max(axis=1))/root_deg), 0, n_rows - 1).astype(np.int64)
+    r1 = np.clip(np.floor((90.0 - poly_lat.min(axis=1))/root_deg), 0, n_rows - 1).astype(np.int64)
+    c0 = np.clip(np.floor((poly_lon.min(axis=1) + 180.0)/root_deg), 0, n_cols - 1).astype(np.int64)
+    c1 = np.clip(np.floor((poly_lon.max(axis=1) + 180.0)/root_deg), 0, n_cols - 1).astype(np.int64)
+
+    n_r = r1 - r0 + 1
+    n_c = c1 - c0 + 1
+    counts = n_r*n_c
+
+    quads = np.repeat(np.arange(len(poly_lat)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+
+    rows = r0[quads] + offsets // n_c[quads]
+    cols = c0[quads] + offsets % n_c[quads]
+
+    return rows, cols, quads
+
+def refine_tiles(rows, cols, quads, poly_lat, poly_lon, boundary, root_deg, max_depth, leaves):
+
+    for level in range(max_depth + 1):
+
+        if len(quads) == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        size = tile_size_deg(root_deg, level)
+        lat_lo, lat_hi, lon_lo, lon_hi = tile_bounds(rows, cols, size)
+
+        q_lat = poly_lat[quads]
+        q_lon = poly_lon[quads]
+
+        edge_hits = np.stack([
+            segments_hit_tiles(q_lon[:, (k - 1) % 4], q_lat[:, (k - 1) % 4], q_lon[:, k], q_lat[:, k],
+                               lat_lo, lat_hi, lon_lo, lon_hi)
+            for k in range(4)], axis=1)
+
+        center_inside = points_in_quads(lon_lo + size/2, lat_lo + size/2, q_lat, q_lon)
+
+        keep = edge_hits.any(axis=1) | center_inside
+        rows, cols, quads = rows[keep], cols[keep], quads[keep]
+        center_inside = center_inside[keep]
+        crossed = (edge_hits[keep] & boundary[quads]).any(axis=1)
+
+        n_cols = int(round(360.0/size))
+        tiles, inverse = np.unique(rows*n_cols + cols, return_inverse=True)
+
+        tile_crossed = np.zeros(len(tiles), dtype=bool)
+        tile_covered = np.zeros(len(tiles), dtype=bool)
+        np.logical_or.at(tile_crossed, inverse, crossed)
+        np.logical_or.at(tile_covered, inverse, center_inside)
+
+        final = ~tile_crossed if level < max_depth else np.ones(len(tiles), dtype=bool)
+        covered = tiles[final & tile_covered]
+
+        leaves.append((np.full(len(covered), level, dtype=np.uint8),
+                       (covered // n_cols).astype(np.uint32),
+                       (covered % n_cols).astype(np.uint32)))
+
+        if level == max_depth:
+            return tiles[tile_crossed] // n_cols
+
+        split = tile_crossed[inverse]
+        rows, cols, quads = rows[split], cols[split], quads[split]
+
+        rows = np.repeat(2*rows, 4) + np.tile([0, 0, 1, 1], len(quads))
+        cols = np.repeat(2*cols, 4) + np.tile([0, 1, 0, 1], len(quads))
+        quads = np.repeat(quads, 4)
+
+    return np.zeros(0, dtype=np.int64)
+
+def build_coverage_quadtree(poly_lat, poly_lon, max_depth, root_deg=10.0, area="plane", strips=None):
+
+    # poly_lat/poly_lon are the (segments, 4) swath quadrilaterals of one
+    # continuous strip, as built by build_swath_polygons_from_track_pairwise.
+    # Several strips (one per spacecraft of a constellation) can be passed
+    # back to back with strips giving the quadrilateral count of each.
+
+    poly_lat = np.asarray(poly_lat, dtype=float).reshape(-1, 4)
+    poly_lon = np.asarray(poly_lon, dtype=float).reshape(-1, 4)
+
+    if strips is None:
+        strips = [len(poly_lat)]
+
+    boundary = np.concatenate([np.zeros((0, 4), dtype=bool)] + [strip_boundary_edges(n) for n in strips])
+    poly_lat, poly_lon, boundary = wrap_quads(poly_lat, poly_lon, boundary)
+
+    rows, cols, quads = root_pairs(poly_lat, poly_lon, root_deg)
+
+    n_root_cols = int(round(360.0/root_deg))
+    roots = rows*n_root_cols + cols
+    order = np.argsort(roots, kind="stable")
+    splits = np.flatnonzero(np.diff(roots[order])) + 1
+
+    leaves = []
+    partial_rows = [np.zeros(0, dtype=np.int64)]
+
+    for group in np.split(order, splits):
+        partial_rows.append(refine_tiles(rows[group], cols[group], quads[group],
+                                         poly_lat, poly_lon, boundary, root_deg, max_depth, leaves))
+
+    partial_rows = np.concatenate(partial_rows)
+
+    if leaves:
+        level, row, col = (np.concatenate(parts) for parts in zip(*leaves))
+    else:
+        level = np.zeros(0, dtype=np.uint8)
+        row = col = np.zeros(0, dtype=np.uint32)
+
+    tree = {
+        "root_deg": float(root_deg),
+        "max_depth": int(max_depth),
+        "level": level,
+        "row": row,
+        "col": col,
+        "area": area,
+        "partial_tiles": len(partial_rows),
+    }
+
+    tree["percent"] = quadtree_percent(tree)
+    tree["error_percent"] = 100.0*float(np.sum(tile_area_fraction(root_deg, max_depth, partial_rows, area)))
+
+    return tree
+
+def tile_area_fraction(root_deg, level, rows, area="plane"):
+
+    size = tile_size_deg(root_deg, level)
+
+    if area == "sphere":
+        lat_hi = np.radians(90.0 - rows*size)
+        lat_lo = np.radians(90.0 - (rows + 1)*size)
+        return (np.sin(lat_hi) - np.sin(lat_lo))/2 * size/360.0
+
+    return np.full(np.shape(rows), size**2 / (180.0*360.0))
+
+def quadtree_percent(tree):
+
+    level = np.asarray(tree["level"], dtype=np.int64)
+    row = np.asarray(tree["row"], dtype=np.int64)
+
+    return 100.0*float(np.sum(tile_area_fraction(tree["root_deg"], level, row, tree.get("area", "plane"))))
+
+def merge_coverage_quadtrees(tree, other):
+
+    # Union of two trees built with the same root_deg, max_depth and area,
+    # e.g. a run and its extension. Leaves inside a leaf of either tree
+    # are dropped; the partial tiles of both still bound the error.
+
+    if (tree["root_deg"], tree["max_depth"], tree.get("area", "plane")) != \
+       (other["root_deg"], other["max_depth"], other.get("area", "plane")):
+        raise ValueError("Only quadtrees with the same root size, depth and area can be merged")
+
+    level = np.concatenate([np.asarray(tree["level"], dtype=np.int64), np.asarray(other["level"], dtype=np.int64)])
+    row = np.concatenate([np.asarray(tree["row"], dtype=np.int64), np.asarray(other["row"], dtype=np.int64)])
+    col = np.concatenate([np.asarray(tree["col"], dtype=np.int64), np.asarray(other["col"], dtype=np.int64)])
+
+    # One key per tile; column counts double with every level
+    n_root_cols = int(round(360.0/tree["root_deg"]))
+    keys = np.unique(np.stack([level, row*n_root_cols*2**level + col], axis=1), axis=0)
+    level, key = keys[:, 0], keys[:, 1]
+    row, col = key // (n_root_cols*2**level), key % (n_root_cols*2**level)
+
+    inside = np.zeros(len(level), dtype=bool)
+
+    for ancestor in np.unique(level):
+
+        ancestor_keys = key[level == ancestor]
+        deeper = level > ancestor
+        shift = level[deeper] - ancestor
+        parent_keys = (row[deeper] >> shift)*n_root_cols*2**ancestor + (col[deeper] >> shift)
+
+        inside[np.flatnonzero(deeper)[np.isin(parent_keys, ancestor_keys)]] = True
+
+    merged = {
+        "root_deg": tree["root_deg"],
+        "max_depth": tree["max_depth"],
+        "level": level[~inside].astype(np.uint8),
+        "row": row[~inside].astype(np.uint32),
+        "col": col[~inside].astype(np.uint32),
+        "area": tree.get("area", "plane"),
+        "partial_tiles": int(tree["partial_tiles"]) + int(other["partial_tiles"]),
+    }
+
+    merged["percent"] = quadtree_percent(merged)
+    merged["error_percent"] = float(tree["error_percent"]) + float(other["error_percent"])
+
+    return merged
+
+def flatten_quadtree(tree, latitudes, longitudes):
+
+    # Samples the tree at the given latitude/longitude vectors (degrees)
+    # and returns a (len(latitudes), len(longitudes)) uint8 raster
+
+    latitudes = np.asarray(latitudes, dtype=float)
+    longitudes = (np.asarray(longitudes, dtype=float) + 180.0) % 360.0 - 180.0
+
+    level = np.asarray(tree["level"], dtype=np.int64)
+    row = np.asarray(tree["row"], dtype=np.int64)
+    col = np.asarray(tree["col"], dtype=np.int64)
+
+    raster = np.zeros((len(latitudes), len(longitudes)), dtype=np.uint8)
+
+    for lvl in np.unique(level):
+
+        size = tile_size_deg(tree["root_deg"], lvl)
+        n_rows = int(round(180.0/size))
+        n_cols = int(round(360.0/size))
+
+        at_level = level == lvl
+        keys = np.sort(row[at_level]*n_cols + col[at_level])
+
+        sample_rows = np.clip(np.floor((90.0 - latitudes)/size), 0, n_rows - 1).astype(np.int64)
+        sample_cols = np.clip(np.floor((longitudes + 180.0)/size), 0, n_cols - 1).astype(np.int64)
+
+        sample_keys = sample_rows[:, None]*n_cols + sample_cols[None, :]
+        found = np.clip(np.searchsorted(keys, sample_keys), 0, len(keys) - 1)
+
+        raster |= (keys[found] == sample_keys).astype(np.uint8)
+
+    return raster
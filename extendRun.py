@@ -0,0 +1,373 @@
+import sys
+import time
+import argparse
+import numpy as np
+from simulationKernels import *
+from monteSetup import *
+from coverageQuadtree import build_coverage_quadtree, merge_coverage_quadtrees
+from coverageGrid import pack_coverage, decode_grid
+from resultBundle import BundleWriter, ResultBundle
+from resultCache import stage_key
+import Monte as M
+import mpy.traj.force.grav.basic as basicGrav
+from mpy.units import *
+
+
+# ----------------------------------------------------------------------
+# RUN EXTENSION
+# ----------------------------------------------------------------------
+
+# Extends a finished run to a later final epoch without recomputing what
+# it already holds. Every fleet member is propagated with DIVA from the
+# inertial state the run saved at its last sample, the new samples are
+# appended to the trajectory streams, event searches only cover the new
+# interval and are stitched to the old events at the boundary, and the
+# new swaths are added into the existing coverage grids and quadtrees.
+# The last old sample is the first new one, so the swath strips and
+# revisit gaps continue across the junction. Repeat ground track results
+# do not depend on the end epoch and are kept as they are.
+#
+#   python extendRun.py monte_data --days 7
+#   python extendRun.py monte_data --final-epoch "01-FEB-2026 00:00:00 ET" --output monte_data_long
+
+EXTENSION_FIELDS = ["simulation_inputs", "inertial_frame", "primary_mu", "orbital_period",
+                    "final_epoch", "sample_end_epoch", "final_states"]
+
+extension_count = 0
+
+def cprint(txt,color="92"):
+
+    color_map = {
+        "red":"91",
+        "green":"92",
+        "yellow":"93",
+        "blue":"94",
+        "purple":"35"
+    }
+
+    color_code = color_map.get(color.lower(),"0")
+
+    print(f"\033[{color_code}m{txt}\033[0m")
+
+def in_memory(value):
+
+    # Columns are memory mapped from the bundle that is about to be rewritten
+
+    if isinstance(value, np.ndarray):
+        return np.array(value)
+    if isinstance(value, dict):
+        return {k: in_memory(v) for k, v in value.items()}
+
+    return value
+
+def load_run(result_path):
+
+    results = ResultBundle(result_path, mmap=False)
+
+    if not results.complete:
+        raise ValueError(f"{result_path} is not a finished run")
+
+    missing = [name for name in EXTENSION_FIELDS if name not in results]
+    if missing:
+        raise KeyError(f"{result_path} was written before runs could be extended; rerun it to record {', '.join(missing)}")
+
+    schema = {}
+    for name, field in results.schema.items():
+        schema.setdefault(field["group"], {})[name] = field["type"]
+
+    values = {name: in_memory(results[name]) for name in results.schema if name in results}
+
+    return values, schema, results.group("trajectory")
+
+def extended_epoch(final_epoch, days):
+
+    # Same time system suffix as the run's own final epoch
+
+    suffix = final_epoch.split()[2:]
+
+    return " ".join([et_to_epoch_string(epoch_string_to_et(final_epoch) + days*86400.0)] + suffix)
+
+def propagate_fleet(boa, names, primary, inertial_frame, states, t_begin, t_end):
+
+    integ = M.IntegSetup(boa)
+
+    for name, state in zip(names, states):
+
+        initialState = M.State(
+            boa, name, primary,
+            M.Cartesian.x(M.UnitDbl(state[0], 'km')),
+            M.Cartesian.y(M.UnitDbl(state[1], 'km')),
+            M.Cartesian.z(M.UnitDbl(state[2], 'km')),
+            M.Cartesian.dx(M.UnitDbl(state[3], 'km/sec')),
+            M.Cartesian.dy(M.UnitDbl(state[4], 'km/sec')),
+            M.Cartesian.dz(M.UnitDbl(state[5], 'km/sec'))
+        )
+
+        basicGrav.add(boa, name, ["Sun", primary])
+
+        integ.add(M.IntegState( boa, t_begin, t_end, [], name, primary,
+                                inertial_frame, inertial_frame, initialState,
+                                [M.GravityForce(boa,name)], False, [], [] ))
+
+    prop = M.DivaPropagator(boa, "DIVA", integ)
+    prop.create(boa, t_begin, t_end)
+
+    return [M.TrajQuery(boa, name, primary, inertial_frame) for name in names]
+
+def sample_fleet(boa, queries, primary, inertial_frame, epochs):
+
+    # Inertial positions and velocities (fleet, samples, 3) and the
+    # body-fixed rotation of every epoch
+
+    frameQuery = M.FrameQuery(boa, inertial_frame, f"IAU {primary} Fixed")
+
+    positions = np.zeros((len(queries), len(epochs), 3))
+    velocities = np.zeros((len(queries), len(epochs), 3))
+    rotations = np.zeros((len(epochs), 3, 3))
+
+    for n, t in enumerate(epochs):
+
+        rotations[n] = np.array(frameQuery.rotation(t), dtype=float).reshape(3, 3)
+
+        for m, query in enumerate(queries):
+            state = query.state(t)
+            statePos = state.pos()
+            stateVel = state.vel()
+            positions[m, n] = statePos[0], statePos[1], statePos[2]
+            velocities[m, n] = stateVel[0], stateVel[1], stateVel[2]
+
+    return positions, velocities, rotations
+
+def search_extension_events(boa, names, stations, bodies, search_interval, step_seconds, processes):
+
+    # (contact events, shadow events) of every fleet member over the new
+    # interval, searched in one pool
+
+    contact_searches = [("contact", station) for station in stations]
+    shadow_searches = [(region, body) for body in bodies for region in ("umbra","penumbra")]
+    per_member = contact_searches + shadow_searches
+
+    event_results = search_events(boa, names[0], search_interval, step_seconds,
+                                  [search + (name,) for name in names for search in per_member],
+                                  processes=processes)
+
+    empty = [np.zeros(0, dtype=EVENT_DTYPE)]
+    member_events = []
+
+    for m in range(len(names)):
+        results = event_results[m*len(per_member):(m + 1)*len(per_member)]
+        member_events.append((np.concatenate(empty + results[:len(contact_searches)]),
+                              np.concatenate(empty + results[len(contact_searches):])))
+
+    return member_events
+
+def extend_run(result_path, final_epoch=None, days=None, output_path=None, boa=None, event_processes=None):
+
+    global extension_count
+
+    start = time.time()
+    extension_count += 1
+
+    values, schema, streams = load_run(result_path)
+    output_path = output_path or result_path
+
+    if final_epoch is None:
+        final_epoch = extended_epoch(values["final_epoch"], days)
+
+    primary = values["primary"]
+    inertial_frame = values["inertial_frame"]
+    step = float(values["time_step_seconds"])
+    radii = (values["primary_equitorial_radius"], values["primary_polar_radius"])
+    stations = list(values.get("stations", {}))
+    bodies = shadow_bodies(primary)
+
+    fleet_size = len(values["final_states"])
+    fleet_names = list(values.get("fleet_names", ["spacecraft"]))
+    names = [f"{name}_ext{extension_count}" for name in fleet_names]
+
+    t0_et = epoch_string_to_et(values["inital_epoch_str"])
+    boundary_et = epoch_string_to_et(values["final_epoch"])
+    tf_et = epoch_string_to_et(final_epoch)
+
+    if tf_et <= boundary_et:
+        raise ValueError(f"{final_epoch} is not after the run's final epoch {values['final_epoch']}")
+
+    if boa is None:
+        boa = load_boa()
+
+    boundary = M.Epoch(values["final_epoch"])
+    t_begin = M.Epoch(values["sample_end_epoch"])
+    tf = M.Epoch(final_epoch)
+
+    cprint(f"Extending {result_path} from {values['final_epoch']} to {final_epoch}","blue")
+
+    queries = propagate_fleet(boa, names, primary, inertial_frame, values["final_states"], t_begin, tf)
+
+
+    # ---- TRAJECTORY ----
+
+    # The first epoch is the run's last sample; it only joins the new
+    # swaths to the old ones and is not appended again
+
+    epochs = M.Epoch.range(t_begin, tf, step*sec)
+    positions, velocities, rotations = sample_fleet(boa, queries, primary, inertial_frame, epochs)
+
+    old_count = len(values["sample_time"])
+    times = values["sample_time"][-1] + np.arange(len(epochs))*step
+
+    fixed = np.einsum("nij,mnj->mni", rotations, positions).reshape(-1, 3)
+    lat, lon, height = (v.reshape(fleet_size, len(epochs)) for v in geodetic_from_cartesian(fixed, *radii))
+
+    new_rows = {
+        "sample_time": times[1:],
+        "latitudes": lat[0, 1:],
+        "longitudes": lon[0, 1:],
+        "heights": height[0, 1:],
+        "xPositions": positions[0, 1:, 0],
+        "yPositions": positions[0, 1:, 1],
+        "zPositions": positions[0, 1:, 2],
+    }
+    new_rows.update(orbital_elements_from_cartesian(positions[0, 1:], velocities[0, 1:], values["primary_mu"]))
+
+    for name in streams:
+        values[name] = np.concatenate([values[name], new_rows[name]])
+
+    all_times = values["sample_time"]
+    new_times = times[1:]
+
+    values["final_epoch"] = str(tf)
+    values["sample_end_epoch"] = str(epochs[-1])
+    values["final_states"] = np.hstack([positions[:, -1], velocities[:, -1]])
+
+
+    # ---- EVENTS ----
+
+    cprint("Searching Events Over the Extension","blue")
+
+    fleet_events = search_extension_events(boa, names, stations, bodies, M.TimeInterval(boundary, tf), step, event_processes)
+
+    contact_events = stitch_events(values["contact_events"], fleet_events[0][0], boundary_et)
+    shadow_events = stitch_events(values["shadow_events"], fleet_events[0][1], boundary_et)
+
+    contact_durations_avg, contact_durations_avg_per, contact_durations = calculate_contact_durations(
+        contact_events, stations, values["orbital_period"], t0_et, tf_et)
+    station_contact, contact_bool = contact_matrix(contact_events, stations, t0_et, tf_et, all_times)
+
+    shadow_array = np.zeros(len(all_times), dtype=bool)
+
+    for body in bodies:
+        prefix = "primary" if body == primary else body.lower()
+        body_shadow = event_timeline(shadow_events[shadow_events["source"] == body], t0_et, all_times)
+        values[f"{prefix}_shadow_array"] = body_shadow
+        shadow_array |= body_shadow
+
+    values.update(contact_events=contact_events, shadow_events=shadow_events,
+                  contact_durations=contact_durations, contact_durations_avg=contact_durations_avg,
+                  contact_durations_avg_per=contact_durations_avg_per,
+                  station_contact=station_contact, contact_bool=contact_bool, shadow_array=shadow_array)
+
+    # Shadow state of every member at the junction sample and after it
+
+    if fleet_size > 1:
+        junction_shadow = values["fleet_shadow"][:, -1]
+    else:
+        junction_shadow = shadow_array[old_count - 1:old_count]
+
+    new_shadow = np.zeros((fleet_size, len(new_times)), dtype=bool)
+    new_shadow[0] = shadow_array[old_count:]
+    new_load = station_contact[:, old_count:].astype(np.uint16)
+
+    for m in range(1, fleet_size):
+        member_contact, member_shadow = fleet_events[m]
+        new_load += contact_matrix(member_contact, stations, t0_et, tf_et, new_times)[0]
+        new_shadow[m] = event_timeline(member_shadow, t0_et, new_times)
+
+    values["station_contact_load"] = np.concatenate([values["station_contact_load"], new_load], axis=1)
+    values["constellation_contact"] = station_load_summary(stations, values["station_contact_load"], step)
+
+    if fleet_size > 1:
+        values["fleet_latitudes"] = np.concatenate([values["fleet_latitudes"], lat[:, 1:]], axis=1)
+        values["fleet_longitudes"] = np.concatenate([values["fleet_longitudes"], lon[:, 1:]], axis=1)
+        values["fleet_heights"] = np.concatenate([values["fleet_heights"], height[:, 1:]], axis=1)
+        values["fleet_shadow"] = np.concatenate([values["fleet_shadow"], new_shadow], axis=1)
+
+
+    # ---- COVERAGE ----
+
+    cprint("Adding the New Swaths to the Coverage","blue")
+
+    in_shadow = np.concatenate([junction_shadow[:, None], new_shadow], axis=1)
+    sensor_fov_deg = float(values["simulation_inputs"]["SpacecraftPhysicalProperties_ConicalSensorFOVdeg"])
+
+    initial = {
+        "coverage": decode_grid(values["total_coverage"]),
+        "coverage_lit": decode_grid(values["lit_coverage"]),
+        **{name: values[name] for name in ("access_count", "first_access", "last_access", "max_revisit_gap")},
+    }
+
+    a,b,c,d,access = calculate_coverage(lat, lon, height, in_shadow, sensor_fov_deg,
+                                        values["coverage_lat_res"], values["coverage_lon_res"],
+                                        *radii, times, values["coverage_grid_type"], initial)
+
+    values["total_coverage"], values["lit_coverage"] = pack_coverage(a), pack_coverage(b)
+    values["total_percent"], values["lit_percent"] = c, d
+    values.update(access)
+
+    # Runs without adaptive quadtrees keep the raster percentages
+
+    if "total_coverage_tree" not in values:
+        return write_extension(values, schema, streams, output_path, start, len(new_times))
+
+    def extend_tree(tree, keep):
+
+        poly_lat, poly_lon, _, _, strips = fleet_swath_polygons(lat, lon, height, keep, times, sensor_fov_deg, *radii,
+                                                                time_order=False)
+        extension = build_coverage_quadtree(poly_lat, poly_lon, tree["max_depth"], tree["root_deg"],
+                                            tree.get("area", "plane"), strips)
+
+        return merge_coverage_quadtrees(tree, extension)
+
+    values["total_coverage_tree"] = extend_tree(values["total_coverage_tree"], np.ones(in_shadow.shape, dtype=bool))
+    values["lit_coverage_tree"] = extend_tree(values["lit_coverage_tree"], ~in_shadow)
+
+    values["total_percent"] = values["total_coverage_tree"]["percent"]
+    values["total_percent_error"] = values["total_coverage_tree"]["error_percent"]
+    values["lit_percent"] = values["lit_coverage_tree"]["percent"]
+    values["lit_percent_error"] = values["lit_coverage_tree"]["error_percent"]
+
+    return write_extension(values, schema, streams, output_path, start, len(new_times))
+
+def write_extension(values, schema, streams, output_path, start, new_samples):
+
+    # New stage keys keep the ground track plot cache from serving the
+    # rendering of the shorter run
+
+    values["stage_keys"] = {stage: stage_key(key, values["final_epoch"]) for stage, key in values.get("stage_keys", {}).items()}
+    values.setdefault("stage_timings", {})["extension"] = time.time() - start
+
+    writer = BundleWriter(output_path, schema)
+    writer.append_rows({name: values[name] for name in streams})
+    writer.publish(values)
+    writer.finish()
+
+    cprint(f"Extended by {new_samples} Samples in {time.time() - start:.1f} [Seconds]","green")
+
+    return ResultBundle(output_path)
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Extend a finished MONTE run to a later final epoch")
+    parser.add_argument("result", help="Result bundle of the run to extend")
+    end = parser.add_mutually_exclusive_group(required=True)
+    end.add_argument("--final-epoch", help='New final epoch, e.g. "01-FEB-2026 00:00:00 ET"')
+    end.add_argument("--days", type=float, help="Extend the run by this many days")
+    parser.add_argument("--output", default=None, help="Write the extended run here instead of over the original")
+    parser.add_argument("--processes", type=int, default=None, help="Event search processes")
+    args = parser.parse_args()
+
+    try:
+        extend_run(args.result, args.final_epoch, args.days, args.output, event_processes=args.processes)
+    except (KeyError, ValueError) as e:
+        cprint(f"Cannot extend {args.result}: {e}","red")
+        sys.exit(1)
@@ -0,0 +1,227 @@
+import os
+import json
+import math
+import time
+import multiprocessing
+import numpy as np
+import Monte as M
+import mpy.io.data as defaultData
+from mpy.units import *
+from simulationKernels import EVENT_DTYPE
+
+
+# ----------------------------------------------------------------------
+# BOA SETUP
+# ----------------------------------------------------------------------
+
+BOA_DATA = [
+    "frame",
+    "body",
+    "ephem/satellite/mars097",
+    "ephem/planet/de405",
+    "station"
+    ]
+
+def load_boa():
+
+    boa = M.BoaLoad()
+
+    defaultData.loadInto(boa, BOA_DATA)
+
+    M.DefaultHorizonMask.addAll( boa )
+
+    return boa
+
+
+# ----------------------------------------------------------------------
+# PRIMARY ROTATION CONSTANTS
+# ----------------------------------------------------------------------
+
+# Solar and sidereal day lengths only depend on the primary and on the
+# loaded ephemeris/frame data, so they are measured once and kept in a
+# JSON cache next to the scripts, keyed on BOA_DATA.
+
+ROTATION_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "rotation_constants.json")
+
+def measure_rotation_constants(boa, primary):
+
+    sunBodyDataBoa = M.BodyDataBoa.read(boa,"Sun")
+    sunBodyData = M.BodyData(boa, "Sun",sunBodyDataBoa.frame(),"Sun")
+    muSun = M.UnitDbl.value(M.BodyData.gm(sunBodyData))
+
+    t_ref = M.Epoch("01-JAN-2000 00:00:00 ET")
+
+    primaryTraj = M.TrajQuery(boa,primary,"Sun","EME2000")
+    primaryState = primaryTraj.state(t_ref, 2)
+    primarySunOrbitalRadius = M.UnitDbl.value(primaryState.posMag())
+    primarySunOrbitalSpeed = M.UnitDbl.value(primaryState.velMag())
+    primarySunSMA = (2/primarySunOrbitalRadius-primarySunOrbitalSpeed**2/muSun)**-1
+    Tprimary = 2*math.pi*math.sqrt(primarySunSMA**3/muSun)
+
+    sunTraj = M.TrajQuery(boa,"Sun",primary,f"IAU {primary} Fixed")
+
+    def sun_longitude(dt):
+        sunState = sunTraj.state(t_ref + dt*sec, 2)
+        return M.UnitDbl.value(M.Geodetic.longitude(sunState))
+
+    # Coarse estimate of the Sun's body-fixed longitude rate from hourly
+    # samples over two days, then refined over doubling baselines. Each
+    # step resolves the whole number of turns from the previous estimate;
+    # the last baseline is one orbital period so the equation of time
+    # averages out.
+
+    coarse_times = np.arange(49)*3600.0
+    coarse_longitudes = np.unwrap([sun_longitude(dt) for dt in coarse_times])
+    rate = np.polyfit(coarse_times, coarse_longitudes, 1)[0]
+
+    lon0 = coarse_longitudes[0]
+    baseline = 2*86400.0
+
+    while True:
+
+        baseline = min(baseline, Tprimary)
+        dlon = sun_longitude(baseline) - lon0
+        turns = round((rate*baseline - dlon)/(2*math.pi))
+        rate = (dlon + 2*math.pi*turns)/baseline
+
+        if baseline >= Tprimary:
+            break
+
+        baseline *= 2
+
+    spin_rate = 2*math.pi/Tprimary - rate
+
+    return {
+        "solar_day": 2*math.pi/abs(rate),
+        "sidereal_day": 2*math.pi/abs(spin_rate),
+        "orbital_period": Tprimary,
+        "rotation_rate": spin_rate,
+    }
+
+def rotation_constants(boa, primary):
+
+    key = "|".join(BOA_DATA)
+    cache = {}
+
+    if os.path.exists(ROTATION_CACHE_PATH):
+        try:
+            with open(ROTATION_CACHE_PATH, "r") as f:
+                cache = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            cache = {}
+
+    if primary in cache.get(key, {}):
+        return cache[key][primary]
+
+    constants = measure_rotation_constants(boa, primary)
+    cache.setdefault(key, {})[primary] = constants
+
+    try:
+        with open(ROTATION_CACHE_PATH, "w") as f:
+            json.dump(cache, f, indent=2)
+    except OSError:
+        pass
+
+    return constants
+
+
+# ----------------------------------------------------------------------
+# PARALLEL EVENT SEARCHES
+# ----------------------------------------------------------------------
+
+# Horizon mask and shadow searches are independent of each other, so they
+# are spread over a pool of forked processes. Forking after propagation
+# gives every worker its own copy of the BOA with the spacecraft
+# trajectory already in it; only (kind, source) tuples and the resulting
+# event record arrays cross the process boundary. A search may name its
+# spacecraft as a third element, so a whole constellation's searches
+# share one pool. Results come back in
+# the order the searches were requested; when a timings dict is given it
+# also receives the wall time of each search, keyed "kind source".
+
+J2000_EPOCH = M.Epoch("01-JAN-2000 12:00:00 ET")
+
+def epoch_to_et(epoch):
+
+    # ET seconds past J2000 from the Epoch itself, not its printed form
+
+    return M.UnitDbl.value(epoch - J2000_EPOCH)
+
+def event_records(events, source, kind):
+
+    # Contact searches return rise/set crossings at a single epoch, shadow
+    # searches return intervals; both are read through the event accessors
+
+    records = np.zeros(len(events), dtype=EVENT_DTYPE)
+
+    for n, event in enumerate(events):
+
+        if kind == "contact":
+            crossing = "rise" if "rise" in str(event.type()).lower() else "set"
+            begin_et = end_et = epoch_to_et(event.epoch())
+            records[n] = (source, crossing, begin_et, end_et)
+        else:
+            interval = event.interval()
+            records[n] = (source, kind, epoch_to_et(interval.begin()), epoch_to_et(interval.end()))
+
+    return records
+
+SHADOW_MOONS = {
+    "Earth": ["Moon"],
+    "Mars": ["Phobos", "Deimos"],
+}
+
+def shadow_bodies(primary):
+
+    # Bodies whose umbra and penumbra are searched for a given primary
+
+    return [primary] + SHADOW_MOONS.get(primary, [])
+
+search_context = {}
+
+def init_event_search(boa, scName, search_interval, step_seconds):
+
+    search_context.update(boa=boa, scName=scName,
+                          search_interval=search_interval, step_seconds=step_seconds)
+
+def run_event_search(search):
+
+    kind, source = search[:2]
+    begin = time.perf_counter()
+    boa = search_context["boa"]
+    scName = search[2] if len(search) > 2 else search_context["scName"]
+
+    if kind == "contact":
+        finder = M.HorizonMaskEvent(M.TrajQuery(boa, scName, source), M.HorizonMaskEvent.CROSSING)
+    elif kind == "umbra":
+        finder = M.ShadowEvent(boa, source, scName, M.ShadowEvent.IN_UMBRA)
+    elif kind == "penumbra":
+        finder = M.ShadowEvent(boa, source, scName, M.ShadowEvent.IN_PENUMBRA)
+    else:
+        raise ValueError(f"Unknown event search: {kind}")
+
+    events = finder.search(search_context["search_interval"], search_context["step_seconds"]*sec)
+
+    return event_records(events, source, kind), time.perf_counter() - begin
+
+def search_events(boa, scName, search_interval, step_seconds, searches, processes=None, timings=None):
+
+    searches = list(searches)
+    context = (boa, scName, search_interval, step_seconds)
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = min(processes, len(searches))
+
+    if processes <= 1:
+        init_event_search(*context)
+        results = [run_event_search(search) for search in searches]
+    else:
+        with multiprocessing.get_context("fork").Pool(processes, initializer=init_event_search, initargs=context) as pool:
+            results = pool.map(run_event_search, searches, chunksize=1)
+
+    if timings is not None:
+        for search, (_, elapsed) in zip(searches, results):
+            timings[" ".join(search)] = elapsed
+
+    return [records for records, _ in results]
@@ -0,0 +1,193 @@
+import os
+import re
+import sys
+import csv
+import time
+import shutil
+import argparse
+import itertools
+import traceback
+import multiprocessing
+import numpy as np
+from monteSetup import load_boa
+from simulationRunner import load_config, run_simulation
+
+
+# ----------------------------------------------------------------------
+# PARAMETRIC SWEEPS
+# ----------------------------------------------------------------------
+
+# Runs every combination of the swept input values against a base
+# input_data.json. Parameters are named like the simulation globals, i.e.
+# the sanitized "Section_Label" input keys such as
+# InitialOrbitalElements_SemiMajorAxiskm. Cases are spread over a pool of
+# forked workers that each load one BOA when they start and then run
+# their cases back to back through run_simulation, headless and with the
+# event searches inline. Every finished case becomes one row of a tidy
+# CSV table.
+#
+#   python parameterSweep.py input_data.json \
+#       --param InitialOrbitalElements_SemiMajorAxiskm=6878:7378:6 \
+#       --param SpacecraftPhysicalProperties_ConicalSensorFOVdeg=10,20,30
+
+SUMMARY_COLUMNS = ["total_percent", "total_percent_error", "lit_percent", "lit_percent_error",
+                   "shadow_fraction", "contact_total_s", "repeat_num_periods", "repeat_num_days"]
+
+sweep_context = {}
+
+def cprint(txt,color="92"):
+
+    color_map = {
+        "red":"91",
+        "green":"92",
+        "yellow":"93",
+        "blue":"94",
+        "purple":"35"
+    }
+
+    color_code = color_map.get(color.lower(),"0")
+
+    print(f"\033[{color_code}m{txt}\033[0m")
+
+def sanitize_key(key):
+
+    # Same mapping monteSimulation.py applies to input keys
+
+    return re.sub(r'[^0-9a-zA-Z_]', '', key)
+
+def parse_values(text):
+
+    # "start:stop:num" is an inclusive linspace, anything else a comma list
+
+    if text.count(":") == 2:
+        start, stop, num = text.split(":")
+        return [float(v) for v in np.linspace(float(start), float(stop), int(num))]
+
+    return [v.strip() for v in text.split(",") if v.strip()]
+
+def sweep_cases(base_config, parameters):
+
+    # parameters maps a global name to its list of values. Inputs hold the
+    # UI's text, so every value is written back as a string that round-trips
+    # exactly.
+
+    keys = {}
+    for name in parameters:
+        matches = [key for key in base_config if sanitize_key(key) == name]
+        if not matches:
+            raise KeyError(f"Sweep parameter {name} is not an input of the base config")
+        keys[name] = matches[0]
+
+    cases = []
+
+    for n, values in enumerate(itertools.product(*parameters.values())):
+
+        config = dict(base_config)
+        for name, value in zip(parameters, values):
+            config[keys[name]] = repr(value) if isinstance(value, float) else str(value)
+
+        cases.append({"case": n, "parameters": dict(zip(parameters, values)), "config": config})
+
+    return cases
+
+def case_summary(results):
+
+    contact = results.get("contact_durations", {})
+    shadow = results.get("shadow_array")
+
+    row = {name: results.get(name) for name in SUMMARY_COLUMNS if name in results}
+    row["shadow_fraction"] = float(np.mean(shadow)) if shadow is not None and len(shadow) else 0.0
+    row["contact_total_s"] = float(sum(contact.values()))
+    row.update({f"contact_s_{station}": seconds for station, seconds in contact.items()})
+
+    return row
+
+def init_sweep_worker(output_dir, keep_bundles):
+
+    sweep_context.update(boa=load_boa(), output_dir=output_dir, keep_bundles=keep_bundles)
+
+def run_case(case):
+
+    result_path = os.path.join(sweep_context["output_dir"], f"case_{case['case']:04d}")
+    start = time.time()
+
+    row = {"case": case["case"], **case["parameters"]}
+
+    try:
+        results = run_simulation(case["config"], sweep_context["boa"], result_path, event_processes=1)
+        row.update(case_summary(results))
+        row["status"] = "complete"
+
+    except Exception as e:
+        traceback.print_exc()
+        row.update(status="failed", error=str(e))
+
+    if not sweep_context["keep_bundles"]:
+        shutil.rmtree(result_path, ignore_errors=True)
+
+    row["elapsed_s"] = time.time() - start
+
+    return row
+
+def write_table(rows, path):
+
+    columns = []
+    for row in rows:
+        columns += [name for name in row if name not in columns]
+
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(rows)
+
+def run_sweep(base_config, parameters, output_dir="sweep_results", processes=None, keep_bundles=True):
+
+    base_config, _ = load_config(base_config)
+    cases = sweep_cases(base_config, parameters)
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = max(min(processes, len(cases)), 1)
+
+    cprint(f"Running {len(cases)} Cases on {processes} Workers","blue")
+
+    rows = []
+    context = multiprocessing.get_context("fork")
+
+    with context.Pool(processes, initializer=init_sweep_worker, initargs=(output_dir, keep_bundles)) as pool:
+        for row in pool.imap_unordered(run_case, cases, chunksize=1):
+            rows.append(row)
+            color = "green" if row["status"] == "complete" else "red"
+            cprint(f"Case {row['case']} {row['status'].capitalize()} ({len(rows)}/{len(cases)}) in {row['elapsed_s']:.1f} [Seconds]", color)
+
+    rows.sort(key=lambda row: row["case"])
+    write_table(rows, os.path.join(output_dir, "sweep_table.csv"))
+
+    return rows
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Run a parametric sweep of MONTE simulations")
+    parser.add_argument("base", help="input_data.json to sweep around")
+    parser.add_argument("--param", action="append", required=True, metavar="NAME=VALUES",
+                        help="NAME=start:stop:num or NAME=v1,v2,...; repeat for more parameters")
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--output-dir", default="sweep_results")
+    parser.add_argument("--no-bundles", action="store_true", help="Only keep the summary table, not each case's result bundle")
+    args = parser.parse_args()
+
+    parameters = {}
+    for spec in args.param:
+        name, _, values = spec.partition("=")
+        parameters[name.strip()] = parse_values(values)
+
+    rows = run_sweep(args.base, parameters, args.output_dir, args.processes, not args.no_bundles)
+
+    failed = sum(row["status"] != "complete" for row in rows)
+    cprint(f"Sweep Complete: {len(rows) - failed} of {len(rows)} Cases Succeeded, Table in {os.path.join(args.output_dir, 'sweep_table.csv')}",
+           "green" if failed == 0 else "yellow")
+
+    sys.exit(1 if failed else 0)
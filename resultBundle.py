@@ -0,0 +1,256 @@
+import os
+import re
+import json
+import numbers
+import numpy as np
+
+
+# ----------------------------------------------------------------------
+# COLUMNAR RESULT BUNDLE
+# ----------------------------------------------------------------------
+
+# Simulation results are written to a directory holding one .npy file per
+# array plus manifest.json. The manifest keeps every scalar, string and
+# small list or dict inline; arrays anywhere in the values, including
+# inside dicts, are replaced by {"__column__": file} references. Readers
+# open columns with memory mapping, so only the pages a viewer actually
+# touches are read from disk. This module only needs numpy.
+#
+# Per-sample trajectory columns can also be streamed while a run is in
+# progress: rows are appended to raw .bin files and the manifest's
+# "stream" table records how many rows are committed. The manifest is
+# always replaced atomically, so a reader attached mid-run sees a
+# consistent prefix of every stream and every field published so far.
+
+BUNDLE_MANIFEST = "manifest.json"
+BUNDLE_VERSION = 1
+
+def column_file(name):
+
+    return re.sub(r'[^0-9A-Za-z_.-]', '_', name) + ".npy"
+
+def json_value(value):
+
+    if isinstance(value, (set, tuple)):
+        value = list(value)
+    if isinstance(value, np.generic):
+        return value.item()
+
+    try:
+        json.dumps(value)
+        return value
+    except (TypeError, OverflowError, ValueError):
+        return str(value)
+
+def manifest_value(path, name, value):
+
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        file = column_file(name)
+        np.save(os.path.join(path, file), value)
+        return {"__column__": file}
+
+    if isinstance(value, np.ndarray):
+        return json_value(value.tolist())
+
+    if isinstance(value, dict):
+        return {str(k): manifest_value(path, f"{name}.{k}", v) for k, v in value.items()}
+
+    return json_value(value)
+
+def clear_bundle(path):
+
+    os.makedirs(path, exist_ok=True)
+
+    for name in os.listdir(path):
+        if name.endswith((".npy", ".bin")):
+            os.remove(os.path.join(path, name))
+
+def commit_manifest(path, manifest):
+
+    manifest_path = os.path.join(path, BUNDLE_MANIFEST)
+
+    with open(manifest_path + ".tmp", "w") as f:
+        json.dump(manifest, f)
+
+    os.replace(manifest_path + ".tmp", manifest_path)
+
+def read_manifest(path):
+
+    with open(os.path.join(path, BUNDLE_MANIFEST), "r") as f:
+        return json.load(f)
+
+
+# ----------------------------------------------------------------------
+# DECLARED RESULT SCHEMA
+# ----------------------------------------------------------------------
+
+# A schema maps group names (trajectory, events, coverage, summary) to
+# {field: type}. BundleWriter persists only declared fields, checks each
+# against its type, and records the schema in the manifest. ResultBundle
+# opens a bundle without loading anything and loads each field the first
+# time it is asked for.
+
+FIELD_TYPES = {
+    "array": lambda v: isinstance(v, np.ndarray),
+    "records": lambda v: isinstance(v, np.ndarray) and v.dtype.names is not None,
+    "packed": lambda v: isinstance(v, dict) and "encoding" in v,
+    "tree": lambda v: isinstance(v, dict) and "level" in v,
+    "dict": lambda v: isinstance(v, dict),
+    "list": lambda v: isinstance(v, (list, tuple)),
+    "str": lambda v: isinstance(v, str),
+    "float": lambda v: isinstance(v, numbers.Real),
+}
+
+def schema_fields(schema):
+
+    return {name: (group, field_type)
+            for group, fields in schema.items()
+            for name, field_type in fields.items()}
+
+class BundleWriter:
+
+    # Writes a bundle incrementally: trajectory chunks with append_rows,
+    # stage outputs with publish, and finish once the run is done.
+
+    def __init__(self, path, schema):
+
+        self.path = path
+        self.fields = schema_fields(schema)
+
+        clear_bundle(path)
+
+        self.manifest = {
+            "version": BUNDLE_VERSION,
+            "complete": False,
+            "values": {},
+            "stream": {},
+            "schema": {},
+        }
+        commit_manifest(path, self.manifest)
+
+    def declare(self, name):
+
+        if name not in self.fields:
+            raise KeyError(f"Result field {name} is not declared in the schema")
+
+        group, field_type = self.fields[name]
+        self.manifest["schema"][name] = {"group": group, "type": field_type}
+
+    def append_rows(self, columns):
+
+        for name, rows in columns.items():
+
+            rows = np.ascontiguousarray(rows)
+            self.declare(name)
+
+            entry = self.manifest["stream"].setdefault(name, {
+                "file": column_file(name)[:-4] + ".bin",
+                "dtype": rows.dtype.str,
+                "shape": list(rows.shape[1:]),
+                "rows": 0,
+            })
+
+            with open(os.path.join(self.path, entry["file"]), "ab") as f:
+                f.write(rows.astype(np.dtype(entry["dtype"]), copy=False).tobytes())
+
+            entry["rows"] += len(rows)
+
+        commit_manifest(self.path, self.manifest)
+
+    def publish(self, values):
+
+        # Declared fields present in values that are not streamed or
+        # already published are checked against their type and written
+
+        for name, (group, field_type) in self.fields.items():
+
+            if name not in values or name in self.manifest["values"] or name in self.manifest["stream"]:
+                continue
+
+            value = values[name]
+            if field_type == "array" and isinstance(value, (list, tuple)):
+                value = np.asarray(value)
+
+            if not FIELD_TYPES[field_type](value):
+                raise TypeError(f"Result field {name} ({group}) is not a {field_type}: {type(value).__name__}")
+
+            self.declare(name)
+            self.manifest["values"][name] = manifest_value(self.path, name, value)
+
+        commit_manifest(self.path, self.manifest)
+
+    def finish(self):
+
+        self.manifest["complete"] = True
+        commit_manifest(self.path, self.manifest)
+
+def write_results(path, values, schema):
+
+    writer = BundleWriter(path, schema)
+    writer.publish(values)
+    writer.finish()
+
+class ResultBundle:
+
+    def __init__(self, path, mmap=True):
+
+        self.path = path
+        self.mmap_mode = "r" if mmap else None
+
+        self.refresh()
+
+    def refresh(self):
+
+        # Re-reads the manifest of a bundle that is still being written
+
+        manifest = read_manifest(self.path)
+        self.complete = manifest.get("complete", True)
+        self.schema = manifest.get("schema", {})
+        self._manifest_values = manifest["values"]
+        self._stream = manifest.get("stream", {})
+        self._loaded = {}
+
+    def _resolve(self, value):
+
+        if isinstance(value, dict):
+            if "__column__" in value:
+                return np.load(os.path.join(self.path, value["__column__"]), mmap_mode=self.mmap_mode)
+            return {k: self._resolve(v) for k, v in value.items()}
+
+        return value
+
+    def _stream_column(self, entry):
+
+        dtype = np.dtype(entry["dtype"])
+        shape = (entry["rows"],) + tuple(entry["shape"])
+
+        if entry["rows"] == 0:
+            return np.zeros(shape, dtype=dtype)
+
+        return np.memmap(os.path.join(self.path, entry["file"]), dtype=dtype, mode="r", shape=shape)
+
+    def __contains__(self, name):
+
+        return name in self._manifest_values or name in self._stream
+
+    def __getitem__(self, name):
+
+        if name not in self._loaded:
+            if name in self._manifest_values:
+                self._loaded[name] = self._resolve(self._manifest_values[name])
+            else:
+                self._loaded[name] = self._stream_column(self._stream[name])
+
+        return self._loaded[name]
+
+    def get(self, name, default=None):
+
+        return self[name] if name in self else default
+
+    def group(self, group):
+
+        return [name for name, field in self.schema.items() if field["group"] == group]
+
+    def fields(self, names):
+
+        return {name: self[name] for name in names if name in self}
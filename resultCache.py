@@ -0,0 +1,155 @@
+import os
+import json
+import shutil
+import hashlib
+import numpy as np
+from resultBundle import BUNDLE_MANIFEST, BUNDLE_VERSION, manifest_value, commit_manifest, read_manifest
+
+
+# ----------------------------------------------------------------------
+# STAGE RESULT CACHE
+# ----------------------------------------------------------------------
+
+# Stage outputs of monteSimulation.py are kept on disk under a hash of
+# exactly the inputs the stage depends on, so a rerun only recomputes the
+# stages whose inputs changed. Every entry is a directory in the result
+# bundle layout: manifest.json plus one .npy file per array. Entries are
+# written to a private temporary directory and renamed into place, so
+# runs sharing a cache (parallel sweeps) never read a partial entry. The
+# cache is kept under its size limit by evicting the least recently used
+# entries; a hit touches the entry's manifest. This module only needs
+# numpy.
+
+CACHE_LIMIT_MB = 2048
+
+def stage_key(*parts):
+
+    text = json.dumps(parts, sort_keys=True, default=str)
+
+    return hashlib.sha256(text.encode()).hexdigest()[:32]
+
+def source_fingerprint(paths):
+
+    # Any edit to the code that produces a stage invalidates its entries
+
+    digest = hashlib.sha256()
+
+    for path in paths:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+
+    return digest.hexdigest()[:16]
+
+def entry_value(path, name, value):
+
+    # Lists of arrays, such as the per-search event records, keep their order
+
+    if isinstance(value, (list, tuple)) and value and all(isinstance(v, np.ndarray) for v in value):
+        return {"__items__": [manifest_value(path, f"{name}.{n}", v) for n, v in enumerate(value)]}
+
+    return manifest_value(path, name, value)
+
+def resolve_entry_value(path, value):
+
+    if isinstance(value, dict):
+        if "__column__" in value:
+            return np.load(os.path.join(path, value["__column__"]))
+        if "__items__" in value:
+            return [resolve_entry_value(path, v) for v in value["__items__"]]
+        return {k: resolve_entry_value(path, v) for k, v in value.items()}
+
+    return value
+
+def directory_size(path):
+
+    return sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+
+class StageCache:
+
+    def __init__(self, path, limit_mb=CACHE_LIMIT_MB):
+
+        self.path = path
+        self.limit_bytes = int(float(limit_mb)*2**20)
+
+        os.makedirs(path, exist_ok=True)
+
+    def entry_path(self, stage, key):
+
+        return os.path.join(self.path, f"{stage}-{key}")
+
+    def load(self, stage, key):
+
+        # Returns {name: value} or None when the entry is missing or was
+        # evicted while being read
+
+        path = self.entry_path(stage, key)
+
+        try:
+            manifest = read_manifest(path)
+            values = {name: resolve_entry_value(path, value) for name, value in manifest["values"].items()}
+            os.utime(os.path.join(path, BUNDLE_MANIFEST))
+
+        except (OSError, ValueError, KeyError):
+            return None
+
+        return values
+
+    def store(self, stage, key, values):
+
+        path = self.entry_path(stage, key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+
+        shutil.rmtree(temp_path, ignore_errors=True)
+        os.makedirs(temp_path)
+
+        commit_manifest(temp_path, {
+            "version": BUNDLE_VERSION,
+            "complete": True,
+            "stage": stage,
+            "values": {name: entry_value(temp_path, name, value) for name, value in values.items()},
+        })
+
+        # Another run may have stored the same entry first
+        try:
+            os.replace(temp_path, path)
+        except OSError:
+            shutil.rmtree(temp_path, ignore_errors=True)
+
+        self.trim()
+
+    def entries(self):
+
+        # (last use, bytes, path) of every entry, oldest first
+
+        entries = []
+
+        for entry in os.scandir(self.path):
+
+            if not entry.is_dir() or entry.name.endswith(".tmp"):
+                continue
+
+            try:
+                used = os.stat(os.path.join(entry.path, BUNDLE_MANIFEST)).st_mtime
+                entries.append((used, directory_size(entry.path), entry.path))
+            except OSError:
+                continue
+
+        return sorted(entries)
+
+    def trim(self):
+
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in entries:
+
+            if total <= self.limit_bytes:
+                break
+
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+
+        shutil.rmtree(self.path, ignore_errors=True)
+        os.makedirs(self.path, exist_ok=True)
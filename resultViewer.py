@@ -0,0 +1,123 @@
+import re
+import sys
+import json
+import runpy
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QApplication, QMainWindow, QTabWidget
+from resultBundle import ResultBundle
+
+
+# ----------------------------------------------------------------------
+# RESULT VIEWER
+# ----------------------------------------------------------------------
+
+# One process hosts every enabled view of a run. The inputs and the result
+# bundle are loaded once and each view script is executed in this process
+# with them, and the shared QApplication, already in its globals; the
+# window it builds is then docked as a tab. View scripts keep working on
+# their own when run directly.
+#
+# The viewer can also be attached to a bundle that a run is still writing.
+# Until the bundle is complete only the views that can draw a partial
+# trajectory are shown, and they are rebuilt from the latest committed
+# rows every REFRESH_SECONDS.
+
+VIEWS = [
+    # input flag, script, window global, tab title, draws partial results
+    ("Plotting_3DVisualization", "3dPlot.py", "plot3D_5", "3-D Plot", False),
+    ("Plotting_GroundTrack", "groundTrackPlot.py", "groundTrackPlot", "Ground Track", True),
+    ("Plotting_OrbitalElements", "orbitalElementsPlot.py", "orbitalElementsPlot", "Orbital Elements", False),
+    (None, "dataWindow.py", "outputWindow", "Data Output", False),
+]
+
+REFRESH_SECONDS = 10
+
+def cprint(txt,color="92"):
+
+    color_map = {
+        "red":"91",
+        "green":"92",
+        "yellow":"93",
+        "blue":"94",
+        "purple":"35"
+    }
+
+    color_code = color_map.get(color.lower(),"0")
+
+    print(f"\033[{color_code}m{txt}\033[0m")
+
+def load_inputs(path):
+
+    # Keys become the global names monteSimulation.py gives the inputs,
+    # e.g. "Plotting_3-D Visualization" -> Plotting_3DVisualization
+
+    with open(path, "r") as f:
+        data = json.load(f)
+
+    return {re.sub(r'[^0-9a-zA-Z_]', '', k): v for k, v in data.items()}
+
+def build_views(inputs, results, app):
+
+    tabs = QTabWidget()
+
+    for flag, script, window_name, title, partial in VIEWS:
+
+        if flag is not None and not inputs.get(flag):
+            continue
+        if not results.complete and not partial:
+            continue
+
+        view_globals = dict(inputs, results=results, app=app)
+        view_globals = runpy.run_path(script, init_globals=view_globals, run_name="resultViewer_view")
+
+        window = view_globals.get(window_name)
+        if window is not None:
+            tabs.addTab(window, title)
+
+    return tabs
+
+def follow_results(host, inputs, results, app, timer):
+
+    # Rebuilds the tabs from whatever the run has committed since the last
+    # refresh, and stops polling once the bundle is complete
+
+    results.refresh()
+
+    tabs = build_views(inputs, results, app)
+    host.setCentralWidget(tabs)
+
+    if results.complete:
+        timer.stop()
+        cprint("Result Bundle Complete", "green")
+
+
+if __name__ == "__main__":
+
+    if len(sys.argv) < 3:
+        print("Usage: python resultViewer.py input_data.json result_bundle")
+        sys.exit(1)
+
+    app = QApplication.instance() or QApplication([])
+
+    inputs = load_inputs(sys.argv[1])
+    results = ResultBundle(sys.argv[2])
+
+    tabs = build_views(inputs, results, app)
+
+    if tabs.count() == 0 and results.complete:
+        sys.exit(0)
+
+    host = QMainWindow()
+    host.setWindowTitle("MONTE Simulation Results")
+    host.setCentralWidget(tabs)
+    host.resize(1200, 800)
+    host.show()
+
+    if not results.complete:
+        timer = QTimer()
+        timer.timeout.connect(lambda: follow_results(host, inputs, results, app, timer))
+        timer.start(REFRESH_SECONDS*1000)
+
+    cprint("Result Viewer Created", "green")
+
+    app.exec_()
@@ -0,0 +1,956 @@
+from datetime import datetime, timedelta
+import numpy as np
+from numba import njit
+from coverageGrid import equal_area_grid
+
+
+# ----------------------------------------------------------------------
+# TRAJECTORY SAMPLE ARRAYS
+# ----------------------------------------------------------------------
+
+# The sampling stage of monteSimulation.py fills one preallocated array
+# per quantity instead of appending to Python lists. Rows are samples.
+
+def allocate_samples(num_samples):
+
+    return {
+        "time": np.zeros(num_samples),
+        "position": np.zeros((num_samples, 3)),
+        "velocity": np.zeros((num_samples, 3)),
+        "rotation": np.zeros((num_samples, 3, 3)),
+        "position_fixed": np.zeros((num_samples, 3)),
+        "latitude": np.zeros(num_samples),
+        "longitude": np.zeros(num_samples),
+        "height": np.zeros(num_samples),
+    }
+
+def rotate_positions(rotations, positions):
+
+    return np.einsum("nij,nj->ni", rotations, positions)
+
+def geodetic_from_cartesian(positions, radius_eq_km, radius_pole_km):
+
+    # Bowring's closed form on the primary's reference ellipsoid. Returns
+    # latitude and longitude in degrees and height above the ellipsoid in km.
+
+    positions = np.asarray(positions, dtype=float)
+    x = positions[:, 0]
+    y = positions[:, 1]
+    z = positions[:, 2]
+
+    a = float(radius_eq_km)
+    b = float(radius_pole_km)
+    e2 = 1 - (b / a)**2
+    ep2 = (a / b)**2 - 1
+
+    p = np.hypot(x, y)
+    theta = np.arctan2(z * a, p * b)
+
+    lat = np.arctan2(z + ep2 * b * np.sin(theta)**3,
+                     p - e2 * a * np.cos(theta)**3)
+    lon = np.arctan2(y, x)
+
+    sin_lat = np.sin(lat)
+    N = a / np.sqrt(1 - e2 * sin_lat**2)
+    height = p * np.cos(lat) + z * sin_lat - a**2 / N
+
+    return np.degrees(lat), np.degrees(lon), height
+
+def fill_geodetic(samples, radius_eq_km, radius_pole_km, start=0, stop=None):
+
+    # Fills rows start:stop, so a sampling loop can finish chunks as it goes
+
+    rows = slice(start, stop)
+
+    samples["position_fixed"][rows] = rotate_positions(samples["rotation"][rows], samples["position"][rows])
+
+    lat, lon, height = geodetic_from_cartesian(samples["position_fixed"][rows], radius_eq_km, radius_pole_km)
+
+    samples["latitude"][rows] = lat
+    samples["longitude"][rows] = lon
+    samples["height"][rows] = height
+
+    return samples
+
+
+# ----------------------------------------------------------------------
+# ORBITAL ELEMENT KERNELS
+# ----------------------------------------------------------------------
+
+# Column layout of the array returned by cartesian_to_elements_numba. Names
+# match the variables the orbital elements plot looks up.
+
+ELEMENT_COLUMNS = [
+    "SemiMajorAxis", "Eccentricity", "Inclination", "RAAN", "ARGP", "TrueAnomaly",
+    "XPosition", "YPosition", "ZPosition", "XVelocity", "YVelocity", "ZVelocity",
+    "Radius", "RadialVelocity", "Latitude", "LatitudinalVelocity", "Longitude", "LongitudinalVelocity",
+    "H", "K", "P", "Q",
+]
+
+ELEMENT_FAMILIES = {
+    "Keplarian": ELEMENT_COLUMNS[0:6],
+    "Cartesian": ELEMENT_COLUMNS[6:12],
+    "Spherical": ELEMENT_COLUMNS[12:18],
+    "Equinoctial": ELEMENT_COLUMNS[18:22],
+}
+
+@njit(cache=True)
+def cartesian_to_elements_numba(states, mu):
+
+    n_samples = states.shape[0]
+    out = np.zeros((n_samples, 22))
+    eps = 1e-11
+    rad2deg = 180.0 / np.pi
+
+    for k in range(n_samples):
+
+        x, y, z = states[k, 0], states[k, 1], states[k, 2]
+        vx, vy, vz = states[k, 3], states[k, 4], states[k, 5]
+
+        r = np.sqrt(x*x + y*y + z*z)
+        v2 = vx*vx + vy*vy + vz*vz
+        rv = x*vx + y*vy + z*vz
+
+        hx = y*vz - z*vy
+        hy = z*vx - x*vz
+        hz = x*vy - y*vx
+        h = np.sqrt(hx*hx + hy*hy + hz*hz)
+
+        nx = -hy
+        ny = hx
+        n = np.sqrt(nx*nx + ny*ny)
+
+        ex = ((v2 - mu/r)*x - rv*vx) / mu
+        ey = ((v2 - mu/r)*y - rv*vy) / mu
+        ez = ((v2 - mu/r)*z - rv*vz) / mu
+        e = np.sqrt(ex*ex + ey*ey + ez*ez)
+
+        sma = -mu / (2.0*(v2/2.0 - mu/r))
+        inc = np.arccos(min(1.0, max(-1.0, hz/h)))
+
+        if n > eps*h:
+            raan = np.arctan2(hx, -hy)
+        else:
+            raan = 0.0
+            nx = 1.0
+            ny = 0.0
+            n = 1.0
+
+        if e > eps:
+            # Signed angles in the orbit plane use the angular momentum as the axis
+            cx = ny*ez
+            cy = -nx*ez
+            cz = nx*ey - ny*ex
+            argp = np.arctan2((hx*cx + hy*cy + hz*cz)/h, nx*ex + ny*ey)
+            cx = ey*z - ez*y
+            cy = ez*x - ex*z
+            cz = ex*y - ey*x
+            tanom = np.arctan2((hx*cx + hy*cy + hz*cz)/h, ex*x + ey*y + ez*z)
+        else:
+            argp = 0.0
+            cx = ny*z
+            cy = -nx*z
+            cz = nx*y - ny*x
+            tanom = np.arctan2((hx*cx + hy*cy + hz*cz)/h, nx*x + ny*y)
+
+        out[k, 0] = sma
+        out[k, 1] = e
+        out[k, 2] = inc*rad2deg
+        out[k, 3] = (raan*rad2deg) % 360.0
+        out[k, 4] = (argp*rad2deg) % 360.0
+        out[k, 5] = (tanom*rad2deg) % 360.0
+
+        out[k, 6] = x
+        out[k, 7] = y
+        out[k, 8] = z
+        out[k, 9] = vx
+        out[k, 10] = vy
+        out[k, 11] = vz
+
+        rxy2 = x*x + y*y
+        out[k, 12] = r
+        out[k, 13] = rv / r
+        out[k, 14] = np.arcsin(z/r)*rad2deg
+        out[k, 15] = (vz - z*rv/(r*r)) / np.sqrt(rxy2) * rad2deg
+        out[k, 16] = np.arctan2(y, x)*rad2deg
+        out[k, 17] = (x*vy - y*vx) / rxy2 * rad2deg
+
+        t = np.tan(inc/2.0)
+        out[k, 18] = e*np.sin(argp + raan)
+        out[k, 19] = e*np.cos(argp + raan)
+        out[k, 20] = t*np.sin(raan)
+        out[k, 21] = t*np.cos(raan)
+
+    return out
+
+def orbital_elements_from_cartesian(positions, velocities, mu, families=None):
+
+    # Returns {variable name: series} for the requested element families
+    # (all of them by default) from one pass over the Cartesian states.
+
+    states = np.ascontiguousarray(np.hstack([positions, velocities]), dtype=np.float64)
+    table = cartesian_to_elements_numba(states, float(mu))
+
+    names = ELEMENT_COLUMNS if families is None else [name for family in families for name in ELEMENT_FAMILIES[family]]
+
+    return {name: table[:, ELEMENT_COLUMNS.index(name)] for name in names}
+
+def cartesian_from_elements(sma, eccentricity, inclination_deg, raan_deg, argp_deg, true_anomaly_deg, mu):
+
+    # Inverse of the Keplerian columns above; arguments broadcast. Returns
+    # (n, 3) positions in km and (n, 3) velocities in km/s.
+
+    sma, eccentricity = np.atleast_1d(sma).astype(float), np.atleast_1d(eccentricity).astype(float)
+    inc, raan, argp, nu = (np.radians(np.atleast_1d(v).astype(float))
+                           for v in (inclination_deg, raan_deg, argp_deg, true_anomaly_deg))
+    sma, eccentricity, inc, raan, argp, nu = np.broadcast_arrays(sma, eccentricity, inc, raan, argp, nu)
+
+    p = sma*(1 - eccentricity**2)
+    r = p/(1 + eccentricity*np.cos(nu))
+
+    r_pqw = np.stack([r*np.cos(nu), r*np.sin(nu), np.zeros_like(r)], axis=1)
+    v_pqw = np.stack([-np.sin(nu), eccentricity + np.cos(nu), np.zeros_like(r)], axis=1)*np.sqrt(mu/p)[:, None]
+
+    cO, sO = np.cos(raan), np.sin(raan)
+    cw, sw = np.cos(argp), np.sin(argp)
+    ci, si = np.cos(inc), np.sin(inc)
+
+    rotation = np.stack([
+        np.stack([cO*cw - sO*sw*ci, -cO*sw - sO*cw*ci, sO*si], axis=1),
+        np.stack([sO*cw + cO*sw*ci, -sO*sw + cO*cw*ci, -cO*si], axis=1),
+        np.stack([sw*si, cw*si, ci], axis=1),
+    ], axis=1)
+
+    return np.einsum("nij,nj->ni", rotation, r_pqw), np.einsum("nij,nj->ni", rotation, v_pqw)
+
+
+# ----------------------------------------------------------------------
+# WALKER CONSTELLATIONS
+# ----------------------------------------------------------------------
+
+# A Walker delta pattern T/P/F puts T satellites in P equally spaced
+# planes of T/P satellites each; satellites in neighbouring planes are
+# phased by F*360/T degrees. Offsets are relative to the lead satellite
+# (index 0) and apply to its RAAN and true anomaly, which is the
+# in-plane phase for the circular orbits the pattern is defined for.
+
+def parse_walker_pattern(text):
+
+    parts = str(text).replace(":", "/").split("/")
+    if len(parts) != 3:
+        raise ValueError(f"Walker pattern must be T/P/F: {text}")
+
+    total, planes, phasing = (int(float(part)) for part in parts)
+
+    if total < 1 or planes < 1 or total % planes != 0:
+        raise ValueError(f"Walker pattern needs T divisible by P: {text}")
+    if not 0 <= phasing < planes:
+        raise ValueError(f"Walker phasing F must be in 0..P-1: {text}")
+
+    return total, planes, phasing
+
+def walker_delta_offsets(total, planes, phasing):
+
+    per_plane = total // planes
+    plane = np.repeat(np.arange(planes), per_plane)
+    slot = np.tile(np.arange(per_plane), planes)
+
+    raan_offset = plane*360.0/planes
+    anomaly_offset = (slot*360.0/per_plane + plane*phasing*360.0/total) % 360.0
+
+    return raan_offset, anomaly_offset
+
+def parse_element_sets(text):
+
+    # Extra spacecraft as Keplerian rows "sma ecc inc raan argp ta" in km
+    # and degrees, separated by semicolons or new lines
+
+    rows = [row.replace(",", " ").split() for row in str(text).replace(";", "\n").splitlines()]
+    rows = [row for row in rows if row]
+
+    if any(len(row) != 6 for row in rows):
+        raise ValueError(f"Element sets need six values per spacecraft: {text}")
+
+    return np.array(rows, dtype=float).reshape(-1, 6)
+
+
+# ----------------------------------------------------------------------
+# REPEAT GROUND TRACK SOLVER
+# ----------------------------------------------------------------------
+
+REPEAT_CANDIDATE_DTYPE = np.dtype([
+    ("Np", np.int64),
+    ("Nd", np.int64),
+    ("nodal_spacing", np.float64),
+    ("mismatch", np.float64),
+])
+
+def repeat_revs_per_day(sma, eccentricity, inclination_rad, mu, j2, radius_eq_km, spin_rate):
+
+    # Revolutions per nodal day: the primary's day measured against the
+    # J2-precessing orbit node instead of inertial space.
+
+    T_sat = 2*np.pi*np.sqrt(sma**3/mu)
+    raan_rate = np.cos(inclination_rad)*(-3/2*np.sqrt(mu)*j2*radius_eq_km**2/((1-eccentricity**2)**2*sma**3.5))
+    nodal_day = 2*np.pi/abs(spin_rate - raan_rate)
+
+    return nodal_day/T_sat
+
+def repeat_ground_track_candidates(revs_per_day, max_days=1000, tolerance=None,
+                                   max_candidates=10, min_days=1, coprime=True):
+
+    # Ranked (Np, Nd) repeat cycles for an orbit making revs_per_day
+    # revolutions per nodal day. mismatch is the fraction of a revolution
+    # left over after Nd days; candidates are sorted by mismatch, then by
+    # cycle length. Non-reduced pairs repeat a shorter cycle and are
+    # dropped unless coprime is False.
+
+    Nd = np.arange(int(min_days), int(max_days) + 1, dtype=np.int64)
+    Ns = Nd*revs_per_day
+    Np = np.rint(Ns).astype(np.int64)
+    mismatch = np.abs(Ns - Np)
+
+    keep = Np > 0
+    if tolerance is not None:
+        keep &= mismatch <= tolerance
+    if coprime:
+        keep &= np.gcd(Np, Nd) == 1
+
+    Nd, Np, mismatch = Nd[keep], Np[keep], mismatch[keep]
+    order = np.lexsort((Nd, mismatch))[:max_candidates]
+
+    table = np.zeros(len(order), dtype=REPEAT_CANDIDATE_DTYPE)
+    table["Np"] = Np[order]
+    table["Nd"] = Nd[order]
+    table["nodal_spacing"] = (360*Nd[order]/Np[order]) % 360
+    table["mismatch"] = mismatch[order]
+
+    return table
+
+
+# ----------------------------------------------------------------------
+# EVENT RECORDS
+# ----------------------------------------------------------------------
+
+# MONTE event search results are converted once (monteSetup.event_records)
+# into a structured array of (source, kind, begin_et, end_et) rows. Times
+# are ET seconds past J2000. Crossing events (kind "rise"/"set") have begin_et == end_et,
+# interval events (kind "umbra"/"penumbra") span the whole interval.
+
+EVENT_DTYPE = np.dtype([
+    ("source", "U32"),
+    ("kind", "U16"),
+    ("begin_et", np.float64),
+    ("end_et", np.float64),
+])
+
+MONTHS = {"JAN": 1, "FEB": 2, "MAR": 3, "APR": 4, "MAY": 5, "JUN": 6,
+          "JUL": 7, "AUG": 8, "SEP": 9, "OCT": 10, "NOV": 11, "DEC": 12}
+
+J2000_ORDINAL = 730120
+
+def epoch_string_to_et(epoch_str):
+
+    # "DD-MON-YYYY HH:MM:SS[.ffff] [ET]" -> seconds past J2000 on the same scale
+
+    parts = epoch_str.split()
+    day, month, year = parts[0].split("-")
+    hours, minutes, seconds = parts[1].split(":")
+
+    days = date_ordinal(int(year), MONTHS[month.upper()], int(day)) - J2000_ORDINAL
+
+    return days*86400.0 + int(hours)*3600.0 + int(minutes)*60.0 + float(seconds) - 43200.0
+
+def date_ordinal(year, month, day):
+
+    # Proleptic Gregorian day number, identical to datetime.date.toordinal()
+
+    y = year - 1
+    days_before_month = [0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334][month - 1]
+    if month > 2 and (year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)):
+        days_before_month += 1
+
+    return y*365 + y//4 - y//100 + y//400 + days_before_month + day
+
+def et_to_epoch_string(et):
+
+    dt = datetime(2000, 1, 1, 12) + timedelta(seconds=float(et))
+
+    return dt.strftime("%d-%b-%Y %H:%M:%S.%f")[:-2].upper()
+
+def contact_intervals(events, source, t0_et, tf_et):
+
+    # Pairs rise/set crossings of one station into (begin, end) contact
+    # intervals. A pass already in progress at t0 or still in progress at
+    # tf is clipped to the run.
+
+    station_events = events[events["source"] == source]
+    station_events = station_events[np.argsort(station_events["begin_et"], kind="stable")]
+
+    begins = []
+    ends = []
+    rise = t0_et
+
+    for event in station_events:
+
+        if event["kind"] == "rise":
+            rise = event["begin_et"]
+
+        elif event["kind"] == "set" and rise is not None:
+            begins.append(rise)
+            ends.append(event["begin_et"])
+            rise = None
+
+    if rise is not None and len(station_events) > 0:
+        begins.append(rise)
+        ends.append(tf_et)
+
+    return np.array(begins, dtype=float), np.array(ends, dtype=float)
+
+def stitch_events(old_events, new_events, boundary_et, tolerance=0.01):
+
+    # Joins the events of a run ending at boundary_et with those of a
+    # search starting there. An interval clipped at the boundary is merged
+    # with its continuation, and rise/set crossings that a search reports
+    # only because it starts or ends at the boundary are dropped.
+
+    old_events = old_events.copy()
+    keep = np.ones(len(new_events), dtype=bool)
+    at_boundary = lambda et: abs(et - boundary_et) <= tolerance
+
+    for n, event in enumerate(new_events):
+
+        if not at_boundary(event["begin_et"]):
+            continue
+
+        same_source = np.flatnonzero(old_events["source"] == event["source"])
+
+        if event["kind"] in ("rise", "set"):
+
+            crossings = [k for k in same_source if old_events["kind"][k] in ("rise", "set")]
+            if not crossings:
+                continue
+
+            last = max(crossings, key=lambda k: old_events["begin_et"][k])
+
+            if old_events["kind"][last] == event["kind"]:
+                keep[n] = False
+            elif at_boundary(old_events["begin_et"][last]):
+                keep[n] = False
+                old_events["kind"][last] = ""
+
+        else:
+
+            clipped = [k for k in same_source
+                       if old_events["kind"][k] == event["kind"] and at_boundary(old_events["end_et"][k])]
+
+            if clipped:
+                old_events["end_et"][clipped[0]] = event["end_et"]
+                keep[n] = False
+
+    events = np.concatenate([old_events[old_events["kind"] != ""], new_events[keep]])
+
+    return events[np.argsort(events["begin_et"], kind="stable")]
+
+def calculate_contact_durations(contact_events,station_names,T,t0_et,tf_et):
+
+    contact_durations_avg = {}
+    contact_durations_avg_per = {}
+    contact_durations = {}
+
+    num_periods = (tf_et-t0_et)/T
+
+    for station in station_names:
+
+        begins, ends = contact_intervals(contact_events,station,t0_et,tf_et)
+        num_events = np.count_nonzero(contact_events["source"] == station)
+
+        total_time = float(np.sum(ends - begins))
+
+        if num_events != 0:
+            contact_durations_avg[station] = total_time/num_events*2
+        else:
+            contact_durations_avg[station] = 0
+        contact_durations_avg_per[station] = total_time/num_periods
+        contact_durations[station] = total_time
+
+    return contact_durations_avg, contact_durations_avg_per, contact_durations
+
+
+# ----------------------------------------------------------------------
+# INTERVAL TIMELINE RASTERIZER
+# ----------------------------------------------------------------------
+
+# A sample at time t is inside [begin, end) intervals. Interval endpoints
+# are located in the sorted sample times with searchsorted and the
+# +1/-1 steps are summed, so a timeline costs O(N + E log N) with no
+# per-sample Python loop. Overlapping intervals are counted, not toggled.
+
+def rasterize_intervals(begins, ends, times):
+
+    begins = np.asarray(begins, dtype=float)
+    ends = np.asarray(ends, dtype=float)
+
+    steps = np.zeros(len(times) + 1, dtype=np.int32)
+    np.add.at(steps, np.searchsorted(times, begins, side="left"), 1)
+    np.add.at(steps, np.searchsorted(times, ends, side="left"), -1)
+
+    return np.cumsum(steps[:-1]) > 0
+
+def interval_matrix(intervals, times):
+
+    # intervals is a sequence of (begins, ends) pairs, one per row. Returns
+    # the (rows x samples) boolean matrix and its union over rows.
+
+    matrix = np.zeros((len(intervals), len(times)), dtype=bool)
+
+    for row, (begins, ends) in enumerate(intervals):
+        matrix[row] = rasterize_intervals(begins, ends, times)
+
+    return matrix, matrix.any(axis=0)
+
+def contact_matrix(events, station_names, t0_et, tf_et, times):
+
+    # times are seconds from t0, like samples["time"]
+
+    intervals = []
+
+    for station in station_names:
+        begins, ends = contact_intervals(events, station, t0_et, tf_et)
+        intervals.append((begins - t0_et, ends - t0_et))
+
+    return interval_matrix(intervals, times)
+
+def event_timeline(events, t0_et, times):
+
+    return rasterize_intervals(events["begin_et"] - t0_et, events["end_et"] - t0_et, times)
+
+def station_load_summary(station_names, load, step_seconds):
+
+    # load is the (stations x samples) count of spacecraft in view
+
+    return {
+        station: {
+            "any_contact_s": float(np.count_nonzero(row))*step_seconds,
+            "total_contact_s": float(np.sum(row))*step_seconds,
+            "mean_in_view": float(np.mean(row)) if len(row) else 0.0,
+            "max_in_view": int(np.max(row)) if len(row) else 0,
+        }
+        for station, row in zip(station_names, load)
+    }
+
+
+# ----------------------------------------------------------------------
+# CONICAL SENSOR GROUND COVERAGE
+# ----------------------------------------------------------------------
+
+# The coverage grid has rows at latitudes 90 - k*lat_res (k = 0..nlat-1,
+# both poles included) and columns at longitudes -180 + j*lon_res. Each
+# swath quadrilateral only touches the rows inside its latitude span, and
+# on each row the even-odd crossings of the polygon edges give the
+# covered longitude spans directly, so the cost is proportional to swath
+# area rather than to grid size. Spans past +-180 wrap around.
+#
+# When segment times are given, the same pass also keeps per-cell access
+# statistics. Consecutive segments share an endpoint time, so a cell hit
+# by a segment starting exactly where its last access ended is still in
+# the same pass; any later start opens a new pass and the idle time in
+# between is a revisit gap.
+#
+# Both fill kernels add their work to KERNEL_COUNTERS (polygons
+# rasterized, grid rows scanned, cells marked) so a profiled run can
+# report how much the coverage stage actually did.
+
+KERNEL_COUNTER_NAMES = ("polygons_rasterized", "rows_scanned", "cells_marked")
+KERNEL_COUNTERS = np.zeros(len(KERNEL_COUNTER_NAMES), dtype=np.int64)
+
+def kernel_counters():
+
+    return {name: int(value) for name, value in zip(KERNEL_COUNTER_NAMES, KERNEL_COUNTERS)}
+
+def reset_kernel_counters():
+
+    KERNEL_COUNTERS[:] = 0
+
+def coverage_grid_shape(lat_res_deg, lon_res_deg):
+
+    nlat = len(np.arange(90, -90 - lat_res_deg, -lat_res_deg))
+    nlon = len(np.arange(-180, 180, lon_res_deg))
+
+    return nlat, nlon
+
+def allocate_access_maps(shape):
+
+    return {
+        "access_count": np.zeros(shape, dtype=np.uint16),
+        "first_access": np.full(shape, np.nan, dtype=np.float32),
+        "last_access": np.full(shape, np.nan, dtype=np.float32),
+        "max_revisit_gap": np.zeros(shape, dtype=np.float32),
+    }
+
+@njit(cache=True)
+def mark_cell(row, col, begin, end, grid, track, count, first, last, gap):
+
+    grid[row, col] = 1
+
+    if not track:
+        return
+
+    if count[row, col] == 0:
+        count[row, col] = 1
+        first[row, col] = begin
+        last[row, col] = end
+        return
+
+    if begin > last[row, col]:
+        if count[row, col] < 65535:
+            count[row, col] += 1
+        gap[row, col] = max(gap[row, col], begin - last[row, col])
+
+    last[row, col] = max(last[row, col], end)
+
+@njit(cache=True)
+def polygon_lat_range(poly_lat, p):
+
+    lat_min = poly_lat[p, 0]
+    lat_max = poly_lat[p, 0]
+    for i in range(1, poly_lat.shape[1]):
+        lat_min = min(lat_min, poly_lat[p, i])
+        lat_max = max(lat_max, poly_lat[p, i])
+
+    return lat_min, lat_max
+
+@njit(cache=True)
+def row_crossings(poly_lat, poly_lon, p, py, crossings):
+
+    # Sorted longitudes where the edges of polygon p cross latitude py
+
+    n_vert = poly_lat.shape[1]
+    n_cross = 0
+
+    for i in range(n_vert):
+        j = (i - 1) % n_vert
+        yi = poly_lat[p, i]
+        yj = poly_lat[p, j]
+        if (yi > py) != (yj > py):
+            xi = poly_lon[p, i]
+            xj = poly_lon[p, j]
+            crossings[n_cross] = (xj - xi)*(py - yi)/(yj - yi + 1e-12) + xi
+            n_cross += 1
+
+    crossings[:n_cross].sort()
+
+    return n_cross
+
+@njit(cache=True)
+def fill_polygons_scanline(poly_lat, poly_lon, seg_begin, seg_end, lat_res, lon_res,
+                           grid, track, count, first, last, gap, counters):
+
+    nlat, nlon = grid.shape
+    crossings = np.empty(poly_lat.shape[1])
+
+    for p in range(poly_lat.shape[0]):
+
+        lat_min, lat_max = polygon_lat_range(poly_lat, p)
+
+        row_first = max(int(np.ceil((90.0 - lat_max)/lat_res)), 0)
+        row_last = min(int(np.floor((90.0 - lat_min)/lat_res)), nlat - 1)
+
+        counters[0] += 1
+        counters[1] += max(row_last - row_first + 1, 0)
+
+        for row in range(row_first, row_last + 1):
+
+            n_cross = row_crossings(poly_lat, poly_lon, p, 90.0 - row*lat_res, crossings)
+
+            for k in range(0, n_cross - 1, 2):
+
+                col_first = int(np.ceil((crossings[k] + 180.0)/lon_res))
+                col_stop = int(np.ceil((crossings[k + 1] + 180.0)/lon_res))
+
+                if col_stop - col_first >= nlon:
+                    col_first = 0
+                    col_stop = nlon
+
+                counters[2] += max(col_stop - col_first, 0)
+
+                for col in range(col_first, col_stop):
+                    mark_cell(row, col % nlon, seg_begin[p], seg_end[p],
+                              grid, track, count, first, last, gap)
+
+@njit(cache=True)
+def fill_polygons_bands(poly_lat, poly_lon, seg_begin, seg_end, band_lat, band_cols, band_offset,
+                        cells, track, count, first, last, gap, counters):
+
+    # Equal-area variant: cells, count, first, last and gap are the flat
+    # cell arrays viewed as (1, cells). Cells are sampled at their centres.
+
+    n_bands = band_lat.shape[0]
+    band_height = 180.0/n_bands
+    crossings = np.empty(poly_lat.shape[1])
+
+    for p in range(poly_lat.shape[0]):
+
+        lat_min, lat_max = polygon_lat_range(poly_lat, p)
+
+        band_first = max(int(np.ceil((90.0 - lat_max)/band_height - 0.5)), 0)
+        band_last = min(int(np.floor((90.0 - lat_min)/band_height - 0.5)), n_bands - 1)
+
+        counters[0] += 1
+        counters[1] += max(band_last - band_first + 1, 0)
+
+        for band in range(band_first, band_last + 1):
+
+            n_cross = row_crossings(poly_lat, poly_lon, p, band_lat[band], crossings)
+            ncol = band_cols[band]
+            width = 360.0/ncol
+
+            for k in range(0, n_cross - 1, 2):
+
+                col_first = int(np.ceil((crossings[k] + 180.0)/width - 0.5))
+                col_stop = int(np.ceil((crossings[k + 1] + 180.0)/width - 0.5))
+
+                if col_stop - col_first >= ncol:
+                    col_first = 0
+                    col_stop = ncol
+
+                counters[2] += max(col_stop - col_first, 0)
+
+                for col in range(col_first, col_stop):
+                    mark_cell(0, band_offset[band] + col % ncol, seg_begin[p], seg_end[p],
+                              cells, track, count, first, last, gap)
+
+def fill_coverage(poly_lat, poly_lon, seg_begin, seg_end, lat_res_deg, lon_res_deg, grid_type,
+                  cells, track, count, first, last, gap):
+
+    if grid_type == "equal_area":
+        table = equal_area_grid(lat_res_deg, lon_res_deg)
+        fill_polygons_bands(poly_lat, poly_lon, seg_begin, seg_end,
+                            table["band_lat"], table["band_cols"], table["band_offset"],
+                            cells.reshape(1, -1), track, count.reshape(1, -1), first.reshape(1, -1),
+                            last.reshape(1, -1), gap.reshape(1, -1), KERNEL_COUNTERS)
+    else:
+        fill_polygons_scanline(poly_lat, poly_lon, seg_begin, seg_end, lat_res_deg, lon_res_deg,
+                               cells, track, count, first, last, gap, KERNEL_COUNTERS)
+
+def great_circle_offset(lat, lon, azimuth_deg, angular_distance_rad):
+    lat1 = np.radians(lat)
+    lon1 = np.radians(lon)
+    az = np.radians(azimuth_deg)
+
+    sin_lat1 = np.sin(lat1)
+    cos_lat1 = np.cos(lat1)
+    sin_d = np.sin(angular_distance_rad)
+    cos_d = np.cos(angular_distance_rad)
+
+    lat2 = np.arcsin(sin_lat1 * cos_d + cos_lat1 * sin_d * np.cos(az))
+    lon2 = lon1 + np.arctan2(
+        np.sin(az) * sin_d * cos_lat1,
+        cos_d - sin_lat1 * np.sin(lat2)
+    )
+
+    return np.degrees(lat2), (np.degrees(lon2) + 540) % 360 - 180
+
+def compute_swath_edges_great_circle(
+    latitudes, longitudes, altitudes_km,
+    sensor_fov_deg, radius_eq_km, radius_pole_km
+):
+    latitudes = np.asarray(latitudes)
+    longitudes = np.unwrap(np.radians(longitudes))
+    longitudes = np.degrees(longitudes)
+    altitudes_km = np.asarray(altitudes_km)
+
+    dlat = np.diff(latitudes, append=latitudes[-1])
+    dlon = np.diff(longitudes, append=longitudes[-1])
+    azimuths = (np.degrees(np.arctan2(dlon, dlat)) + 360) % 360
+
+    lat_rad = np.radians(latitudes)
+    r_surface = np.sqrt((radius_eq_km * np.cos(lat_rad))**2 +
+                        (radius_pole_km * np.sin(lat_rad))**2)
+
+    half_fov_rad = np.radians(sensor_fov_deg / 2)
+    swath_offset_rad = np.tan(half_fov_rad) * altitudes_km / r_surface
+
+    left_lat, left_lon = great_circle_offset(latitudes, longitudes, azimuths - 90, swath_offset_rad)
+    right_lat, right_lon = great_circle_offset(latitudes, longitudes, azimuths + 90, swath_offset_rad)
+
+    return left_lat, left_lon, right_lat, right_lon
+
+def build_swath_polygons_from_track_pairwise(
+    latitudes, longitudes, altitudes_km,
+    sensor_fov_deg, radius_eq_km, radius_pole_km
+):
+    # Returns (samples-1, 4) vertex arrays, one quadrilateral per track
+    # segment, with longitudes unwrapped within each quadrilateral.
+
+    left_lat, left_lon, right_lat, right_lon = compute_swath_edges_great_circle(
+        latitudes, longitudes, altitudes_km,
+        sensor_fov_deg, radius_eq_km, radius_pole_km
+    )
+
+    poly_lat = np.stack([left_lat[:-1], left_lat[1:], right_lat[1:], right_lat[:-1]], axis=1)
+    poly_lon = np.stack([left_lon[:-1], left_lon[1:], right_lon[1:], right_lon[:-1]], axis=1)
+    poly_lon = np.degrees(np.unwrap(np.radians(poly_lon), axis=1))
+
+    return poly_lat, poly_lon
+
+def fleet_swath_polygons(latitudes, longitudes, altitudes_km, keep, times,
+                         sensor_fov_deg, radius_eq_km, radius_pole_km, time_order=True):
+
+    # Swath quadrilaterals of every spacecraft's kept samples. With
+    # time_order they are sorted by segment start time, so per-cell revisit
+    # bookkeeping sees visits from the whole fleet in time order; without
+    # it each spacecraft's strip stays contiguous, as the quadtree needs.
+    # strips holds the number of quadrilaterals each spacecraft
+    # contributed, in fleet order.
+
+    polygons = []
+    strips = []
+
+    for m in range(latitudes.shape[0]):
+
+        rows = np.flatnonzero(keep[m])
+        if len(rows) < 2:
+            strips.append(0)
+            continue
+
+        poly_lat, poly_lon = build_swath_polygons_from_track_pairwise(
+            latitudes[m, rows], longitudes[m, rows], altitudes_km[m, rows],
+            sensor_fov_deg, radius_eq_km, radius_pole_km
+        )
+        polygons.append((poly_lat, poly_lon, times[rows[:-1]], times[rows[1:]]))
+        strips.append(len(poly_lat))
+
+    if not polygons:
+        empty = np.zeros((0, 4))
+        return empty, empty, np.zeros(0), np.zeros(0), strips
+
+    poly_lat, poly_lon, seg_begin, seg_end = (np.concatenate(parts) for parts in zip(*polygons))
+
+    if time_order and len(polygons) > 1:
+        order = np.argsort(seg_begin, kind="stable")
+        poly_lat, poly_lon, seg_begin, seg_end = poly_lat[order], poly_lon[order], seg_begin[order], seg_end[order]
+
+    return poly_lat, poly_lon, seg_begin, seg_end, strips
+
+def calculate_coverage(
+    latitudes, longitudes, altitudes_km,
+    in_shadow,
+    sensor_fov_deg,
+    lat_res_deg, lon_res_deg,
+    radius_eq_km, radius_pole_km,
+    times=None,
+    grid_type="equirectangular",
+    initial=None
+):
+    # times are the sample times in seconds from t0. Access maps are only
+    # accumulated for the full coverage grid, and only when times is given.
+    # With grid_type "equal_area" every returned grid is the flat cell
+    # array of coverageGrid.equal_area_grid and percentages are area
+    # weighted. Track arrays may also be (spacecraft, samples) for a
+    # constellation; the grids are then the union over the fleet and the
+    # revisit gaps count a visit by any spacecraft. initial continues an
+    # earlier run: a dict with its "coverage" and "coverage_lit" grids and
+    # access maps, which the new swaths are added into.
+
+    latitudes = np.atleast_2d(latitudes)
+    longitudes = np.atleast_2d(longitudes)
+    altitudes_km = np.atleast_2d(altitudes_km)
+    in_shadow = np.atleast_2d(in_shadow)
+
+    if grid_type == "equal_area":
+        weights = equal_area_grid(lat_res_deg, lon_res_deg)["cell_weight"]
+        coverage = np.zeros(len(weights), dtype=np.uint8)
+    else:
+        weights = None
+        coverage = np.zeros(coverage_grid_shape(lat_res_deg, lon_res_deg), dtype=np.uint8)
+    coverage_lit_only = np.zeros_like(coverage)
+
+    track = times is not None
+    access = allocate_access_maps(coverage.shape if track else (0, 0))
+    scratch = (np.zeros((0, 0), dtype=np.uint16),) + (np.zeros((0, 0), dtype=np.float64),)*3
+
+    if initial is not None:
+        coverage[:] = np.asarray(initial["coverage"]).reshape(coverage.shape)
+        coverage_lit_only[:] = np.asarray(initial["coverage_lit"]).reshape(coverage.shape)
+        if track:
+            for name in access:
+                access[name][:] = np.asarray(initial[name]).reshape(coverage.shape)
+
+    if track:
+        times = np.asarray(times, dtype=np.float64)
+        access_state = (access["access_count"],
+                        access["first_access"].astype(np.float64),
+                        access["last_access"].astype(np.float64),
+                        access["max_revisit_gap"].astype(np.float64))
+    else:
+        times = np.arange(latitudes.shape[1], dtype=np.float64)
+        access_state = scratch
+
+    swath = (sensor_fov_deg, radius_eq_km, radius_pole_km)
+
+    poly_lat, poly_lon, seg_begin, seg_end, _ = fleet_swath_polygons(
+        latitudes, longitudes, altitudes_km, np.ones(latitudes.shape, dtype=bool), times, *swath)
+    if len(poly_lat):
+        fill_coverage(poly_lat, poly_lon, seg_begin, seg_end, lat_res_deg, lon_res_deg, grid_type,
+                      coverage, track, *access_state)
+
+    poly_lat, poly_lon, seg_begin, seg_end, _ = fleet_swath_polygons(
+        latitudes, longitudes, altitudes_km, ~in_shadow, times, *swath)
+    if len(poly_lat):
+        fill_coverage(poly_lat, poly_lon, seg_begin, seg_end, lat_res_deg, lon_res_deg, grid_type,
+                      coverage_lit_only, False, *scratch)
+
+    if track:
+        access["first_access"][:] = access_state[1]
+        access["last_access"][:] = access_state[2]
+        access["max_revisit_gap"][:] = access_state[3]
+
+    if weights is not None:
+        percent_all = 100.0 * np.dot(weights, coverage)
+        percent_lit = 100.0 * np.dot(weights, coverage_lit_only)
+    else:
+        percent_all = 100.0 * np.sum(coverage) / coverage.size
+        percent_lit = 100.0 * np.sum(coverage_lit_only) / coverage.size
+
+    return coverage, coverage_lit_only, percent_all, percent_lit, access
+
+
+# ----------------------------------------------------------------------
+# PROGRESS MESSAGES
+# ----------------------------------------------------------------------
+
+# Stages of a run in order, with the fraction of the whole run at which
+# each one starts. A stage's own fraction is scaled into the span up to
+# the next stage, so a listener gets one monotonic overall fraction it
+# can extrapolate a remaining time from.
+
+PROGRESS_STAGES = (
+    ("setup", 0.0),
+    ("propagation", 0.05),
+    ("sampling", 0.35),
+    ("events", 0.55),
+    ("coverage", 0.7),
+    ("repeat", 0.95),
+    ("export", 0.97),
+)
+
+def progress_message(stage, stage_fraction, elapsed, samples=0, events=0):
+
+    names = [name for name, _ in PROGRESS_STAGES]
+    index = names.index(stage)
+
+    begin = PROGRESS_STAGES[index][1]
+    end = PROGRESS_STAGES[index + 1][1] if index + 1 < len(PROGRESS_STAGES) else 1.0
+
+    stage_fraction = min(max(float(stage_fraction), 0.0), 1.0)
+
+    return {
+        "status": "progress",
+        "stage": stage,
+        "stage_fraction": stage_fraction,
+        "fraction": begin + (end - begin)*stage_fraction,
+        "samples": int(samples),
+        "events": int(events),
+        "elapsed": float(elapsed),
+    }
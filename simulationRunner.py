@@ -0,0 +1,167 @@
+import os
+import sys
+import json
+import time
+import runpy
+import argparse
+import traceback
+from monteSetup import load_boa
+from resultBundle import ResultBundle
+
+
+# ----------------------------------------------------------------------
+# SIMULATION RUNNER
+# ----------------------------------------------------------------------
+
+# run_simulation executes monteSimulation.py in the calling process with
+# the inputs already in its globals, the same way simulationWorker.py and
+# resultViewer.py run their scripts, and returns the finished result
+# bundle. Every call gets fresh script globals, so one process can run
+# any number of simulations against a single loaded BOA. Viewers are only
+# started when asked for; detached viewers are left running when the
+# call returns. event_processes caps the event search pool;
+# callers that are themselves pool workers pass 1. Runs share the stage
+# cache in cache_path unless it is None.
+#
+# Run as a script it is a headless batch runner:
+#
+#   python simulationRunner.py runs/*.json --output-dir batch_results
+
+SIMULATION_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "monteSimulation.py")
+
+run_count = 0
+
+def cprint(txt,color="92"):
+
+    color_map = {
+        "red":"91",
+        "green":"92",
+        "yellow":"93",
+        "blue":"94",
+        "purple":"35"
+    }
+
+    color_code = color_map.get(color.lower(),"0")
+
+    print(f"\033[{color_code}m{txt}\033[0m")
+
+def load_config(config):
+
+    # A config is the nested dict written by userInterface.py as
+    # input_data.json, or the path of such a file
+
+    if isinstance(config, dict):
+        return config, None
+
+    with open(config, "r") as f:
+        return json.load(f), config
+
+def run_simulation(config, boa=None, result_path="monte_data", sc_name=None,
+                   viewers=False, profile=False, report_progress=None, event_processes=None,
+                   cache_path="monte_cache", detach_viewers=False):
+
+    global run_count
+
+    data, input_path = load_config(config)
+    run_count += 1
+
+    # Spacecraft names must be unique within a BOA, so repeated runs
+    # against a shared BOA never reuse an earlier trajectory
+
+    init_globals = {
+        "simulation_config": data,
+        "input_path": input_path,
+        "result_path": result_path,
+        "launch_viewers": viewers,
+        "detach_viewers": detach_viewers,
+        "profile_run": profile,
+        "event_search_processes": event_processes,
+        "cache_path": cache_path,
+        "scName": sc_name or f"spacecraft{run_count}",
+    }
+
+    if boa is not None:
+        init_globals["boa"] = boa
+    if report_progress is not None:
+        init_globals["report_progress"] = report_progress
+
+    runpy.run_path(SIMULATION_SCRIPT, init_globals=init_globals, run_name="__main__")
+
+    return ResultBundle(result_path)
+
+
+# ----------------------------------------------------------------------
+# HEADLESS BATCH RUNS
+# ----------------------------------------------------------------------
+
+def batch_result_paths(input_paths, output_dir):
+
+    # One bundle directory per input, named after the input file
+
+    paths = []
+    used = set()
+
+    for input_path in input_paths:
+
+        name = os.path.splitext(os.path.basename(input_path))[0]
+        candidate = name
+        n = 1
+        while candidate in used:
+            n += 1
+            candidate = f"{name}_{n}"
+        used.add(candidate)
+
+        paths.append(os.path.join(output_dir, candidate))
+
+    return paths
+
+def run_batch(input_paths, output_dir, profile=False, cache_path="monte_cache"):
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    boa = load_boa()
+    summary = []
+
+    for input_path, result_path in zip(input_paths, batch_result_paths(input_paths, output_dir)):
+
+        cprint(f"Running {input_path} -> {result_path}","blue")
+        start = time.time()
+
+        try:
+            results = run_simulation(input_path, boa, result_path, profile=profile, cache_path=cache_path)
+            status = {"status": "complete", "total_percent": results.get("total_percent")}
+
+        except Exception as e:
+            traceback.print_exc()
+            status = {"status": "failed", "error": str(e)}
+
+        status.update(input=input_path, result=result_path, elapsed=time.time() - start)
+        summary.append(status)
+
+        if status["status"] == "complete":
+            cprint(f"Complete in {status['elapsed']:.1f} [Seconds]","green")
+        else:
+            cprint(f"Failed: {status['error']}","red")
+
+    with open(os.path.join(output_dir, "batch_summary.json"), "w") as f:
+        json.dump(summary, f, indent=2)
+
+    return summary
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Run MONTE simulations headless, one result bundle per input file")
+    parser.add_argument("inputs", nargs="+", help="input_data.json files written by the user interface")
+    parser.add_argument("--output-dir", default="batch_results")
+    parser.add_argument("--profile", action="store_true", help="Write cProfile stats into every result bundle")
+    parser.add_argument("--cache-dir", default="monte_cache", help="Stage result cache shared by the runs")
+    parser.add_argument("--no-cache", action="store_true", help="Recompute every stage of every run")
+    args = parser.parse_args()
+
+    summary = run_batch(args.inputs, args.output_dir, args.profile, None if args.no_cache else args.cache_dir)
+
+    failed = sum(run["status"] != "complete" for run in summary)
+    cprint(f"Batch Complete: {len(summary) - failed} of {len(summary)} Runs Succeeded","green" if failed == 0 else "yellow")
+
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,92 @@
+import sys
+import time
+import traceback
+import warnings
+from multiprocessing.connection import Connection
+from monteSetup import load_boa
+from simulationRunner import run_simulation
+
+
+# ----------------------------------------------------------------------
+# WARM SIMULATION WORKER
+# ----------------------------------------------------------------------
+
+# Long-lived process started by userInterface.py. The MONTE BOA, the
+# ephemerides and every heavy import are loaded once, then each run
+# request received over the connection runs the simulation in this
+# process against the already loaded BOA through run_simulation. The
+# result viewer of a run is detached, so a run is reported complete as
+# soon as its result bundle is finished and the next one can start while
+# the viewer is still open.
+
+warnings.filterwarnings("ignore", message = "A NumPy version >=")
+
+def cprint(txt,color="92"):
+
+    color_map = {
+        "red":"91",
+        "green":"92",
+        "yellow":"93",
+        "blue":"94",
+        "purple":"35"
+    }
+
+    color_code = color_map.get(color.lower(),"0")
+
+    print(f"\033[{color_code}m{txt}\033[0m")
+
+def run_request(conn, boa, run_number, json_path, profile=False):
+
+    # Every run gets its own spacecraft name so trajectories and force
+    # models from earlier runs in the shared BOA are never reused. Progress
+    # messages from the run are forwarded over the same connection.
+
+    def report_progress(message):
+        conn.send(dict(message, run=run_number))
+
+    run_simulation(json_path, boa, sc_name=f"spacecraft{run_number}", viewers=True, detach_viewers=True,
+                   profile=profile, report_progress=report_progress)
+
+def serve(conn):
+
+    boa = load_boa()
+    conn.send({"status": "ready"})
+
+    run_number = 0
+
+    while True:
+
+        try:
+            request = conn.recv()
+        except EOFError:
+            break
+
+        if request.get("command") == "shutdown":
+            break
+
+        if request.get("command") != "run":
+            continue
+
+        run_number += 1
+        start = time.time()
+
+        try:
+            run_request(conn, boa, run_number, request["input"], request.get("profile", False))
+            conn.send({"status": "complete", "run": run_number, "elapsed": time.time() - start})
+
+        except BaseException as e:
+            if isinstance(e, KeyboardInterrupt):
+                raise
+            traceback.print_exc()
+            conn.send({"status": "failed", "run": run_number, "error": str(e)})
+
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+
+    if len(sys.argv) < 2:
+        print("Usage: python simulationWorker.py connection_fd")
+        sys.exit(1)
+
+    serve(Connection(int(sys.argv[1])))